@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Archive Verification
+Streams and CRC-checks every member of a backup ZIP across a thread pool,
+and times a restore drill into a scratch directory
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import zipfile
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from parallel_zip import needs_zstd_reader, iter_zstd_member
+from stream_zip import safe_relative_path
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _verify_members(zip_path, names):
+    """Worker: read members to EOF so zipfile checks each CRC; returns (bytes, errors)"""
+    total = 0
+    errors = []
+    # Each worker gets its own handle; decompression releases the GIL
+    with zipfile.ZipFile(zip_path) as zipf:
+        for name in names:
+            try:
+                info = zipf.getinfo(name)
+                if needs_zstd_reader(info):
+                    # Written with the zstandard fallback; zipfile can't decompress it here
+                    for chunk in iter_zstd_member(zip_path, info, CHUNK_SIZE):
+                        total += len(chunk)
+                    continue
+                with zipf.open(name) as member:
+                    while True:
+                        chunk = member.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        total += len(chunk)
+            except Exception as e:
+                errors.append((name, str(e)))
+    return total, errors
+
+
+def verify_archive(zip_path, workers=None):
+    """CRC-check every member of a ZIP in parallel
+
+    Returns a result dict with member and byte counts, throughput, and a list
+    of (member, error) pairs. A truncated or unreadable archive is reported as
+    an error rather than raised.
+    """
+    zip_path = Path(zip_path)
+    workers = workers or min(8, os.cpu_count() or 1)
+    result = {
+        'archive': str(zip_path),
+        'members': 0,
+        'bytes': 0,
+        'seconds': 0.0,
+        'mb_per_sec': 0.0,
+        'errors': [],
+    }
+
+    start = time.perf_counter()
+    try:
+        with zipfile.ZipFile(zip_path) as zipf:
+            infos = [info for info in zipf.infolist() if not info.is_dir()]
+    except (zipfile.BadZipFile, OSError) as e:
+        result['errors'].append((zip_path.name, f"Unreadable archive: {e}"))
+        return result
+
+    # Deal members round-robin by size so workers finish at about the same time
+    infos.sort(key=lambda info: info.file_size, reverse=True)
+    batches = [[info.filename for info in infos[i::workers]] for i in range(workers)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for total, errors in pool.map(lambda names: _verify_members(zip_path, names),
+                                      [batch for batch in batches if batch]):
+            result['bytes'] += total
+            result['errors'].extend(errors)
+
+    result['members'] = len(infos)
+    result['seconds'] = time.perf_counter() - start
+    if result['seconds'] > 0:
+        result['mb_per_sec'] = result['bytes'] / 1024 / 1024 / result['seconds']
+    return result
+
+
+def restore_drill(zip_path, scratch_root=None):
+    """Time a full extraction into a scratch directory, then remove it"""
+    zip_path = Path(zip_path)
+    scratch_dir = Path(tempfile.mkdtemp(prefix='restore-drill-', dir=scratch_root))
+    result = {'archive': str(zip_path), 'files': 0, 'bytes': 0, 'seconds': 0.0, 'mb_per_sec': 0.0, 'error': None}
+
+    try:
+        start = time.perf_counter()
+        with zipfile.ZipFile(zip_path) as zipf:
+            for info in zipf.infolist():
+                if not needs_zstd_reader(info):
+                    zipf.extract(info, scratch_dir)
+                    continue
+                rel_path = safe_relative_path(info.filename)
+                if rel_path is None:
+                    raise zipfile.BadZipFile(f"Unsafe member name: {info.filename!r}")
+                target = scratch_dir / rel_path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, 'wb') as f:
+                    for chunk in iter_zstd_member(zip_path, info, CHUNK_SIZE):
+                        f.write(chunk)
+        result['seconds'] = time.perf_counter() - start
+
+        for file_path in scratch_dir.rglob('*'):
+            if file_path.is_file():
+                result['files'] += 1
+                result['bytes'] += file_path.stat().st_size
+        if result['seconds'] > 0:
+            result['mb_per_sec'] = result['bytes'] / 1024 / 1024 / result['seconds']
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    return result
+
+
+def record_history(history_path, verify_result, drill_result=None):
+    """Append one JSON line per run so restore time can be tracked as the site grows"""
+    entry = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'archive': Path(verify_result['archive']).name,
+        'members': verify_result['members'],
+        'bytes': verify_result['bytes'],
+        'verify_seconds': round(verify_result['seconds'], 3),
+        'verify_errors': len(verify_result['errors']),
+    }
+    if drill_result:
+        entry['restore_seconds'] = round(drill_result['seconds'], 3)
+        entry['restore_error'] = drill_result['error']
+
+    history_path = Path(history_path)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def verify(zip_path, workers=None, drill=False, history_path=None):
+    """Verify an archive (and optionally run a restore drill), printing a report"""
+    print(f"🔎 Verifying {zip_path}...")
+    result = verify_archive(zip_path, workers=workers)
+
+    if result['errors']:
+        print(f"❌ {len(result['errors'])} member(s) failed verification:")
+        for name, error in result['errors'][:20]:
+            print(f"   {name}: {error}")
+    else:
+        print(f"✅ {result['members']} members OK, {result['bytes'] / 1024 / 1024:.2f}MB "
+              f"in {result['seconds']:.2f}s ({result['mb_per_sec']:.1f}MB/s)")
+
+    drill_result = None
+    if drill and not result['errors']:
+        print(f"🧪 Running restore drill...")
+        drill_result = restore_drill(zip_path)
+        if drill_result['error']:
+            print(f"❌ Restore drill failed: {drill_result['error']}")
+        else:
+            print(f"✅ Restored {drill_result['files']} files, {drill_result['bytes'] / 1024 / 1024:.2f}MB "
+                  f"in {drill_result['seconds']:.2f}s ({drill_result['mb_per_sec']:.1f}MB/s)")
+
+    if history_path:
+        record_history(history_path, result, drill_result)
+
+    return not result['errors'] and not (drill_result and drill_result['error'])
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Verify backup archives and time a restore drill')
+    parser.add_argument('archives', nargs='+', help='ZIP archives to verify')
+    parser.add_argument('--workers', type=int, default=None, help='Verification threads (default: min(8, CPU count))')
+    parser.add_argument('--drill', action='store_true', help='Also time a full extraction into a scratch directory')
+    parser.add_argument('--history', help='Append results to this JSON-lines file (e.g. backups/verify-history.jsonl)')
+
+    args = parser.parse_args()
+
+    all_ok = True
+    for archive in args.archives:
+        if not verify(archive, workers=args.workers, drill=args.drill, history_path=args.history):
+            all_ok = False
+
+    sys.exit(0 if all_ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Backup Catalog
+SQLite index of every export archive, content backup and content snapshot,
+queryable by path without decompressing anything, with retention pruning
+"""
+
+import sys
+import json
+import sqlite3
+import zipfile
+from pathlib import Path
+from datetime import datetime, timedelta
+
+from snapshot_store import SnapshotStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS archives (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    created TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    archive_id INTEGER NOT NULL REFERENCES archives(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    crc INTEGER,
+    digest TEXT,
+    mtime TEXT,
+    PRIMARY KEY (archive_id, path)
+);
+CREATE INDEX IF NOT EXISTS entries_path ON entries(path);
+"""
+
+# Archive kinds, as recorded in the catalog
+EXPORT = 'export'
+CONTENT_BACKUP = 'content-backup'
+SNAPSHOT = 'snapshot'
+
+
+class BackupCatalog:
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _replace_archive(self, name, kind, path, created, size, rows):
+        with self.conn:
+            self.conn.execute('DELETE FROM archives WHERE name = ?', (name,))
+            cursor = self.conn.execute(
+                'INSERT INTO archives (name, kind, path, created, size) VALUES (?, ?, ?, ?, ?)',
+                (name, kind, str(path), created, size))
+            archive_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO entries (archive_id, path, size, crc, digest, mtime) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                ((archive_id, *row) for row in rows))
+        return archive_id
+
+    def add_zip(self, zip_path, kind):
+        """Index a ZIP archive from its central directory only"""
+        zip_path = Path(zip_path)
+        with zipfile.ZipFile(zip_path) as zipf:
+            rows = [(info.filename, info.file_size, info.CRC, None,
+                     datetime(*info.date_time).isoformat())
+                    for info in zipf.infolist() if not info.is_dir()]
+
+        st = zip_path.stat()
+        created = datetime.fromtimestamp(st.st_mtime).isoformat(timespec='seconds')
+        return self._replace_archive(zip_path.name, kind, zip_path, created, st.st_size, rows)
+
+    def add_snapshot(self, manifest, manifest_path):
+        """Index a snapshot store manifest (see snapshot_store.py)"""
+        rows = [(path, meta['size'], None, meta['sha256'],
+                 datetime.fromtimestamp(meta['mtime'] / 1e9).isoformat(timespec='seconds'))
+                for path, meta in manifest['files'].items()]
+        size = sum(meta['size'] for meta in manifest['files'].values())
+        return self._replace_archive(f"snapshot-{manifest['id']}", SNAPSHOT, manifest_path,
+                                     manifest['created'], size, rows)
+
+    def archives(self, kind=None):
+        """Return archive rows, oldest first"""
+        if kind:
+            query = 'SELECT * FROM archives WHERE kind = ? ORDER BY created, name'
+            return self.conn.execute(query, (kind,)).fetchall()
+        return self.conn.execute('SELECT * FROM archives ORDER BY created, name').fetchall()
+
+    def find(self, path):
+        """Return every archive containing a path (exact match or '%' LIKE pattern)"""
+        op = 'LIKE' if '%' in path else '='
+        return self.conn.execute(
+            f'SELECT a.name, a.kind, a.created, e.path, e.size, e.crc, e.digest, e.mtime '
+            f'FROM entries e JOIN archives a ON a.id = e.archive_id '
+            f'WHERE e.path {op} ? ORDER BY a.created, a.name, e.path', (path,)).fetchall()
+
+    def _entries(self, name):
+        rows = self.conn.execute(
+            'SELECT e.path, e.size, e.crc, e.digest FROM entries e '
+            'JOIN archives a ON a.id = e.archive_id WHERE a.name = ?', (name,)).fetchall()
+        if not rows and not self.conn.execute('SELECT 1 FROM archives WHERE name = ?', (name,)).fetchone():
+            raise KeyError(f"Archive not in catalog: {name}")
+        return {row['path']: (row['size'], row['crc'], row['digest']) for row in rows}
+
+    def diff(self, name_a, name_b):
+        """Compare two cataloged archives: returns dict of added/removed/modified paths"""
+        a, b = self._entries(name_a), self._entries(name_b)
+        modified = []
+        for path in sorted(a.keys() & b.keys()):
+            size_a, crc_a, digest_a = a[path]
+            size_b, crc_b, digest_b = b[path]
+            if size_a != size_b:
+                modified.append(path)
+            elif crc_a is not None and crc_b is not None and crc_a != crc_b:
+                modified.append(path)
+            elif digest_a is not None and digest_b is not None and digest_a != digest_b:
+                modified.append(path)
+        return {
+            'added': sorted(b.keys() - a.keys()),
+            'removed': sorted(a.keys() - b.keys()),
+            'modified': modified,
+        }
+
+    def prune(self, keep_last=None, keep_days=None, kind=None, dry_run=False):
+        """Apply retention per archive kind, deleting pruned archives from disk
+
+        An archive survives if it is among the newest keep_last of its kind or
+        younger than keep_days. Returns the pruned archive rows.
+        """
+        if keep_last is None and keep_days is None:
+            return []
+
+        cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat() if keep_days is not None else None
+        kinds = [kind] if kind else [row['kind'] for row in
+                                     self.conn.execute('SELECT DISTINCT kind FROM archives')]
+        pruned = []
+
+        for archive_kind in kinds:
+            rows = self.archives(archive_kind)[::-1]  # newest first
+            for index, row in enumerate(rows):
+                if keep_last is not None and index < keep_last:
+                    continue
+                if cutoff is not None and row['created'] >= cutoff:
+                    continue
+                pruned.append(row)
+
+        if dry_run:
+            return pruned
+
+        for row in pruned:
+            archive_path = Path(row['path'])
+            if archive_path.exists():
+                archive_path.unlink()
+            with self.conn:
+                self.conn.execute('DELETE FROM archives WHERE id = ?', (row['id'],))
+        return pruned
+
+    def rebuild(self, backups_dir):
+        """Index every archive and snapshot manifest already in backups_dir"""
+        backups_dir = Path(backups_dir)
+        count = 0
+        for zip_path in sorted(backups_dir.glob('*.zip')):
+            kind = CONTENT_BACKUP if zip_path.name.startswith('content-backup-') else EXPORT
+            try:
+                self.add_zip(zip_path, kind)
+                count += 1
+            except zipfile.BadZipFile:
+                print(f"   ⚠️  Skipping unreadable archive: {zip_path.name}")
+        for manifest_path in sorted((backups_dir / 'snapshots' / 'manifests').glob('*.json')):
+            self.add_snapshot(json.loads(manifest_path.read_text()), manifest_path)
+            count += 1
+        return count
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Query and prune the backup catalog')
+    parser.add_argument('--db', default='backups/catalog.sqlite3', help='Catalog database (default: backups/catalog.sqlite3)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help='List cataloged archives')
+    find_parser = subparsers.add_parser('find', help='Show which archives contain a path')
+    find_parser.add_argument('path', help="Path inside the archive (use %% as a wildcard)")
+    diff_parser = subparsers.add_parser('diff', help='Show what changed between two archives')
+    diff_parser.add_argument('archive_a')
+    diff_parser.add_argument('archive_b')
+    prune_parser = subparsers.add_parser('prune', help='Apply retention policy')
+    prune_parser.add_argument('--keep-last', type=int, help='Keep the newest N archives of each kind')
+    prune_parser.add_argument('--keep-days', type=int, help='Keep archives younger than N days')
+    prune_parser.add_argument('--kind', choices=[EXPORT, CONTENT_BACKUP, SNAPSHOT], help='Only prune this kind')
+    prune_parser.add_argument('--dry-run', action='store_true', help='Show what would be pruned')
+    rebuild_parser = subparsers.add_parser('rebuild', help='Index archives already in the backups directory')
+    rebuild_parser.add_argument('--backups-dir', default='backups')
+
+    args = parser.parse_args()
+
+    with BackupCatalog(args.db) as catalog:
+        if args.command == 'list':
+            for row in catalog.archives():
+                print(f"{row['created']}  {row['kind']:<15} {row['name']}  ({row['size'] / 1024:.1f}KB)")
+
+        elif args.command == 'find':
+            rows = catalog.find(args.path)
+            if not rows:
+                print(f"ℹ️  No archives contain {args.path}")
+                sys.exit(1)
+            for row in rows:
+                checksum = f"crc={row['crc']:08x}" if row['crc'] is not None else f"sha256={row['digest'][:12]}"
+                print(f"{row['created']}  {row['name']}  {row['path']}  {row['size']}B  {checksum}")
+
+        elif args.command == 'diff':
+            try:
+                changes = catalog.diff(args.archive_a, args.archive_b)
+            except KeyError as e:
+                print(f"❌ {e.args[0]}")
+                sys.exit(1)
+            for label, symbol in (('added', '+'), ('removed', '-'), ('modified', '~')):
+                for path in changes[label]:
+                    print(f"{symbol} {path}")
+            print(f"\n📊 {len(changes['added'])} added, {len(changes['removed'])} removed, "
+                  f"{len(changes['modified'])} modified")
+
+        elif args.command == 'prune':
+            pruned = catalog.prune(args.keep_last, args.keep_days, kind=args.kind, dry_run=args.dry_run)
+            verb = 'Would prune' if args.dry_run else 'Pruned'
+            for row in pruned:
+                print(f"🗑️  {verb} {row['kind']} {row['name']}")
+            print(f"✅ {verb} {len(pruned)} archive(s)")
+
+            # Pruning a snapshot only drops its manifest; free the blobs nothing references now
+            if not args.dry_run:
+                store_roots = {Path(row['path']).parent.parent for row in pruned if row['kind'] == SNAPSHOT}
+                for store_root in sorted(store_roots):
+                    if store_root.exists():
+                        removed, freed = SnapshotStore(store_root).gc()
+                        print(f"🗑️  Removed {removed} unreferenced blobs from {store_root} ({freed / 1024:.2f}KB)")
+
+        elif args.command == 'rebuild':
+            count = catalog.rebuild(args.backups_dir)
+            print(f"✅ Indexed {count} archive(s) into {args.db}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Export Latency Model
+Records how long Micro.blog takes from export trigger to "Export ready" email,
+and turns that history into an email polling schedule
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+
+
+class ExportLatencyModel:
+    """Rolling window of export latencies (seconds) stored as JSON
+
+    With enough history, polling is sparse before the expected arrival window,
+    dense inside it (p10..p90), and sparse again afterwards. Without history
+    it reproduces the fixed schedule: 60s initial wait, then retry_interval.
+    """
+
+    def __init__(self, path, window=30, min_samples=3):
+        self.path = Path(path)
+        self.window = window
+        self.min_samples = min_samples
+        self.samples = []
+        if self.path.exists():
+            try:
+                self.samples = json.loads(self.path.read_text()).get('samples', [])
+            except (ValueError, OSError):
+                self.samples = []
+
+    def record(self, latency_seconds):
+        """Append a latency sample and persist the most recent window"""
+        self.samples.append({
+            'recorded': datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(latency_seconds, 1),
+        })
+        self.samples = self.samples[-self.window:]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({'samples': self.samples}, indent=2) + '\n')
+
+    def percentile(self, pct):
+        """Linear-interpolated percentile of the recorded latencies"""
+        values = sorted(sample['seconds'] for sample in self.samples)
+        if not values:
+            return None
+        rank = (len(values) - 1) * pct / 100
+        lower = int(rank)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+    def schedule(self, max_retries=50, retry_interval=24, dense_interval=10, initial_wait=60):
+        """Return the list of waits (seconds) before each poll attempt
+
+        The total wait never exceeds the fixed schedule's timeout, so a slow
+        export is given at least as long as before.
+        """
+        fixed = [initial_wait] + [retry_interval] * (max_retries - 1)
+        if len(self.samples) < self.min_samples:
+            return fixed
+
+        deadline = sum(fixed)
+        window_start = max(15, self.percentile(10) - dense_interval)
+        if window_start >= deadline:
+            # Past exports arrived after the timeout; a learned window can't start in time
+            return fixed
+        window_end = self.percentile(90) + 2 * dense_interval
+        sparse_interval = 2 * retry_interval
+
+        waits = [round(window_start)]
+        elapsed = waits[0]
+        while elapsed < deadline:
+            wait = dense_interval if elapsed < window_end else sparse_interval
+            wait = min(wait, deadline - elapsed)
+            waits.append(round(wait))
+            elapsed += wait
+        return waits
+
+    def describe(self):
+        if len(self.samples) < self.min_samples:
+            return f"fixed schedule ({len(self.samples)}/{self.min_samples} latency samples recorded)"
+        return (f"learned schedule from {len(self.samples)} exports "
+                f"(p10 {self.percentile(10):.0f}s, p50 {self.percentile(50):.0f}s, p90 {self.percentile(90):.0f}s)")
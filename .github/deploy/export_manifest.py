@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Export Manifests
+Compact per-export manifests built from the ZIP central directory only,
+and a diff of posts and assets between two weekly exports
+"""
+
+import sys
+import json
+import zipfile
+from pathlib import Path
+from datetime import datetime
+
+MANIFEST_VERSION = 1
+
+
+def find_theme_prefix(names):
+    """Return the archive prefix the theme lives under ('' for root level)"""
+    if any(name.startswith('content/') for name in names):
+        return ''
+
+    top_dirs = sorted({name.split('/', 1)[0] for name in names
+                       if '/' in name and not name.startswith('__MACOSX')})
+    for top in top_dirs:
+        if any(name.startswith(f'{top}/content/') for name in names):
+            return f'{top}/'
+    return f'{top_dirs[0]}/' if top_dirs else None
+
+
+def is_post(path):
+    """Posts and pages are markdown under content/; everything else is an asset"""
+    return path.startswith('content/') and path.endswith('.md')
+
+
+def build_manifest(zip_path):
+    """Build a manifest of {path: [size, crc32]} without decompressing any member
+
+    Paths are relative to the theme root so manifests from exports with
+    different top-level directory names still line up.
+    """
+    zip_path = Path(zip_path)
+    with zipfile.ZipFile(zip_path) as zipf:
+        infos = [info for info in zipf.infolist()
+                 if not info.is_dir()
+                 and not info.filename.startswith('__MACOSX/')
+                 and not Path(info.filename).name.startswith('._')]
+
+    prefix = find_theme_prefix([info.filename for info in infos]) or ''
+    files = {info.filename[len(prefix):]: [info.file_size, info.CRC]
+             for info in infos if info.filename.startswith(prefix)}
+
+    return {
+        'version': MANIFEST_VERSION,
+        'archive': zip_path.name,
+        'created': datetime.fromtimestamp(zip_path.stat().st_mtime).isoformat(timespec='seconds'),
+        'prefix': prefix,
+        'files': dict(sorted(files.items())),
+    }
+
+
+def save_manifest(manifest, manifests_dir):
+    manifests_dir = Path(manifests_dir)
+    manifests_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = manifests_dir / f"{Path(manifest['archive']).stem}.json"
+    manifest_path.write_text(json.dumps(manifest, separators=(',', ':')) + '\n')
+    return manifest_path
+
+
+def load_manifest(path):
+    """Load a manifest from a .json file, or build one from a .zip"""
+    path = Path(path)
+    if path.suffix == '.zip':
+        return build_manifest(path)
+    return json.loads(path.read_text())
+
+
+def list_manifests(manifests_dir):
+    """Return manifest paths ordered by export creation time, oldest first"""
+    paths = list(Path(manifests_dir).glob('*.json'))
+    return sorted(paths, key=lambda p: (json.loads(p.read_text())['created'], p.name))
+
+
+def diff_manifests(old, new):
+    """Return added/removed/modified paths, each split into posts and assets"""
+    old_files, new_files = old['files'], new['files']
+    changes = {
+        'added': sorted(new_files.keys() - old_files.keys()),
+        'removed': sorted(old_files.keys() - new_files.keys()),
+        'modified': sorted(path for path in old_files.keys() & new_files.keys()
+                           if old_files[path] != new_files[path]),
+    }
+    return {
+        change: {
+            'posts': [path for path in paths if is_post(path)],
+            'assets': [path for path in paths if not is_post(path)],
+        }
+        for change, paths in changes.items()
+    }
+
+
+def print_diff(old, new, diff, verbose=True):
+    print(f"📊 Changes from {old['archive']} to {new['archive']}:")
+    for change, symbol in (('added', '+'), ('removed', '-'), ('modified', '~')):
+        posts, assets = diff[change]['posts'], diff[change]['assets']
+        print(f"   {change.capitalize()}: {len(posts)} posts, {len(assets)} assets")
+        if verbose:
+            for path in posts + assets:
+                print(f"     {symbol} {path}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build and diff export manifests without unzipping')
+    parser.add_argument('--manifests-dir', default='backups/manifests',
+                        help='Where manifests are stored (default: backups/manifests)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build and save a manifest for an export ZIP')
+    build_parser.add_argument('zip_path')
+    diff_parser = subparsers.add_parser('diff', help='Diff two exports (ZIP or manifest paths)')
+    diff_parser.add_argument('old')
+    diff_parser.add_argument('new')
+    diff_parser.add_argument('--summary', action='store_true', help='Only print counts')
+    diff_parser.add_argument('--json', action='store_true', help='Print the diff as JSON')
+    latest_parser = subparsers.add_parser('latest', help='Diff the two most recent saved manifests')
+    latest_parser.add_argument('--summary', action='store_true', help='Only print counts')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        manifest = build_manifest(args.zip_path)
+        manifest_path = save_manifest(manifest, args.manifests_dir)
+        print(f"✅ Manifest saved: {manifest_path} ({len(manifest['files'])} files)")
+        return
+
+    if args.command == 'latest':
+        manifests = list_manifests(args.manifests_dir)
+        if len(manifests) < 2:
+            print(f"ℹ️  Need at least two manifests in {args.manifests_dir}")
+            sys.exit(1)
+        old, new = load_manifest(manifests[-2]), load_manifest(manifests[-1])
+    else:
+        old, new = load_manifest(args.old), load_manifest(args.new)
+
+    diff = diff_manifests(old, new)
+    if getattr(args, 'json', False):
+        print(json.dumps(diff, indent=2))
+    else:
+        print_diff(old, new, diff, verbose=not args.summary)
+
+
+if __name__ == '__main__':
+    main()
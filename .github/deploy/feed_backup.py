@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Micro.blog Incremental Feed Backup
+Backs up new posts from the site's own JSON feeds (feed.json and
+archive/index.json) without the export/email round trip
+"""
+
+import os
+import sys
+import json
+import re
+import requests
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_SITE_URL = 'https://waccamaw.org/'
+
+
+def parse_date(value):
+    """Parse a feed date_published value (Hugo emits 2006-01-02T15:04:05-07:00)"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class FeedBackup:
+    def __init__(self, site_url=None, backups_dir='backups', concurrency=4):
+        self.site_url = (site_url or os.getenv('MICROBLOG_SITE_URL') or DEFAULT_SITE_URL).rstrip('/') + '/'
+        self.root = Path(backups_dir) / 'feed'
+        self.state_path = self.root / 'state.json'
+        self.concurrency = concurrency
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'waccamaw-feed-backup/1.0'})
+        self.state = self._load_state()
+
+    def _load_state(self):
+        if self.state_path.exists():
+            return json.loads(self.state_path.read_text())
+        return {'watermark': None, 'validators': {}}
+
+    def _save_state(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.state, indent=2) + '\n')
+        os.replace(tmp_path, self.state_path)
+
+    def conditional_get(self, url):
+        """GET with If-None-Match/If-Modified-Since from the last response
+
+        Returns (status, response); status is 304 when the resource is unchanged.
+        """
+        headers = {}
+        validators = self.state['validators'].get(url, {})
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code == 200:
+            self.state['validators'][url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+        return response.status_code, response
+
+    def fetch_feed(self, path):
+        """Fetch a JSON feed; returns its items, [] when unchanged (304), or None on error"""
+        url = self.site_url + path
+        try:
+            status, response = self.conditional_get(url)
+        except requests.RequestException as e:
+            print(f"❌ Error fetching {url}: {e}")
+            return None
+
+        if status == 304:
+            print(f"   ✓ {path} unchanged (304)")
+            return []
+        if status != 200:
+            print(f"❌ Failed to fetch {url}: {status}")
+            return None
+
+        try:
+            items = response.json().get('items', [])
+        except ValueError as e:
+            print(f"❌ Invalid JSON from {url}: {e}")
+            return None
+        print(f"   📄 {path}: {len(items)} items")
+        return items
+
+    def _fetch_post_html(self, item):
+        """Worker: fetch a post page for items the full-content feed no longer carries
+
+        Returns (item, html, error); html and error are both None when the page
+        answered 304, i.e. an earlier run already saved it unchanged.
+        """
+        try:
+            status, response = self.conditional_get(item['url'])
+        except requests.RequestException as e:
+            return item, None, str(e)
+        if status == 200:
+            return item, response.text, None
+        if status == 304:
+            return item, None, None
+        return item, None, f"HTTP {status}"
+
+    def _post_path(self, snapshot_dir, item):
+        """Mirror the post's URL path, e.g. 2025/08/01/meeting-summary.json"""
+        url_path = item['url'].split('://', 1)[-1].split('/', 1)[-1].strip('/') or 'index'
+        safe = re.sub(r'[^A-Za-z0-9._/-]', '_', url_path).replace('..', '_')
+        return snapshot_dir / 'posts' / f'{safe}.json'
+
+    def run(self):
+        """Back up posts published after the watermark; returns the number saved, or None on error"""
+        print("🚀 Micro.blog Incremental Feed Backup")
+        print("=" * 60)
+        watermark = parse_date(self.state.get('watermark'))
+        print(f"🌐 Site: {self.site_url}")
+        print(f"🔖 Watermark: {watermark.isoformat() if watermark else 'none (first run backs up everything)'}")
+
+        # feed.json carries full content for the newest posts; the archive lists every post
+        recent = self.fetch_feed('feed.json')
+        archive = self.fetch_feed('archive/index.json')
+        if recent is None or archive is None:
+            return None
+
+        full_content = {item['url']: item for item in recent if item.get('url')}
+        candidates = {item['url']: item for item in archive + recent if item.get('url')}
+        new_items = [item for item in candidates.values()
+                     if watermark is None or (parse_date(item.get('date_published')) or watermark) > watermark]
+        new_items.sort(key=lambda item: item.get('date_published', ''))
+
+        if not new_items:
+            self._save_state()
+            print("✅ No new posts since last backup")
+            return 0
+
+        snapshot_dir = self.root / datetime.now().strftime('%Y%m%d-%H%M%S')
+        saved = 0
+        unchanged = 0
+        errors = 0
+        to_fetch = []
+
+        for item in new_items:
+            if item['url'] in full_content:
+                self._write_post(snapshot_dir, {**item, **full_content[item['url']]})
+                saved += 1
+            else:
+                to_fetch.append(item)
+
+        if to_fetch:
+            print(f"⬇️  Fetching {len(to_fetch)} older posts ({self.concurrency} at a time)...")
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                for item, html, error in pool.map(self._fetch_post_html, to_fetch):
+                    if error:
+                        print(f"   ⚠️  {item['url']}: {error}")
+                        errors += 1
+                        continue
+                    if html is None:
+                        # Saved by the run that stored this page's validators
+                        unchanged += 1
+                        continue
+                    self._write_post(snapshot_dir, {**item, 'page_html': html})
+                    saved += 1
+
+        # Only advance the watermark past posts that were actually saved, and
+        # forget the feed validators on failure so a 304 can't hide the retry
+        if errors:
+            for path in ('feed.json', 'archive/index.json'):
+                self.state['validators'].pop(self.site_url + path, None)
+        else:
+            dates = [d for d in (parse_date(item.get('date_published')) for item in new_items) if d]
+            if dates:
+                self.state['watermark'] = max(dates).isoformat()
+        self._save_state()
+
+        print()
+        print("=" * 60)
+        print(f"✅ Saved {saved} new posts to {snapshot_dir}")
+        if unchanged:
+            print(f"   ✓ {unchanged} posts unchanged since an earlier backup (304)")
+        if errors:
+            print(f"⚠️  {errors} posts failed; watermark not advanced so they are retried next run")
+        return saved
+
+    def _write_post(self, snapshot_dir, item):
+        path = self._post_path(snapshot_dir, item)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(item, indent=2, ensure_ascii=False) + '\n')
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Incremental backup of new posts from the site JSON feeds')
+    parser.add_argument('--site-url', help=f'Site base URL (default: MICROBLOG_SITE_URL or {DEFAULT_SITE_URL})')
+    parser.add_argument('--backups-dir', default='backups', help='Backups directory (default: backups)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent post page fetches (default: 4)')
+    parser.add_argument('--reset', action='store_true', help='Forget the watermark and back up every post')
+
+    args = parser.parse_args()
+
+    backup = FeedBackup(site_url=args.site_url, backups_dir=args.backups_dir, concurrency=args.concurrency)
+    if args.reset:
+        backup.state = {'watermark': None, 'validators': {}}
+
+    saved = backup.run()
+    sys.exit(0 if saved is not None else 1)
+
+
+if __name__ == '__main__':
+    main()
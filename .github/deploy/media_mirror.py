@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Micro.blog Media Mirror
+Mirrors uploaded photos referenced by photos/index.json and post content into
+a content-addressed store, using conditional requests so unchanged media
+costs a 304
+"""
+
+import os
+import sys
+import json
+import hashlib
+import requests
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+from feed_backup import DEFAULT_SITE_URL
+
+# Load environment variables
+load_dotenv()
+
+MEDIA_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif', '.heic')
+
+
+class ImageSrcParser(HTMLParser):
+    """Collect <img src> values from post HTML"""
+
+    def __init__(self):
+        super().__init__()
+        self.sources = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'img':
+            src = dict(attrs).get('src')
+            if src:
+                self.sources.append(src)
+
+
+class MediaMirror:
+    def __init__(self, site_url=None, backups_dir='backups', concurrency=8):
+        self.site_url = (site_url or os.getenv('MICROBLOG_SITE_URL') or DEFAULT_SITE_URL).rstrip('/') + '/'
+        self.root = Path(backups_dir) / 'media'
+        self.objects_dir = self.root / 'objects'
+        self.index_path = self.root / 'index.json'
+        self.concurrency = concurrency
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'waccamaw-media-mirror/1.0'})
+        self.index = json.loads(self.index_path.read_text()) if self.index_path.exists() else {}
+
+    def _save_index(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.index, indent=2, sort_keys=True) + '\n')
+        os.replace(tmp_path, self.index_path)
+
+    def _fetch_json(self, path):
+        url = self.site_url + path
+        try:
+            response = self.session.get(url, timeout=30)
+            if response.status_code != 200:
+                print(f"   ⚠️  {path}: HTTP {response.status_code}")
+                return []
+            return response.json().get('items', [])
+        except (requests.RequestException, ValueError) as e:
+            print(f"   ⚠️  {path}: {e}")
+            return []
+
+    def collect_urls(self):
+        """Gather image URLs from photos/index.json and the HTML of recent posts"""
+        urls = set()
+        for path in ('photos/index.json', 'feed.json'):
+            items = self._fetch_json(path)
+            print(f"   📄 {path}: {len(items)} items")
+            for item in items:
+                if item.get('image'):
+                    urls.add(urljoin(self.site_url, item['image']))
+                parser = ImageSrcParser()
+                parser.feed(item.get('content_html') or '')
+                for src in parser.sources:
+                    urls.add(urljoin(item.get('url') or self.site_url, src))
+
+        return sorted(url for url in urls
+                      if urlparse(url).scheme in ('http', 'https')
+                      and urlparse(url).path.lower().endswith(MEDIA_EXTENSIONS))
+
+    def _object_path(self, sha256, url):
+        suffix = Path(urlparse(url).path).suffix.lower()
+        return self.objects_dir / sha256[:2] / f'{sha256[2:]}{suffix}'
+
+    def mirror_one(self, url):
+        """Worker: conditionally download one file; returns (url, status, entry or error)"""
+        entry = self.index.get(url)
+        headers = {}
+        if entry and self._object_path(entry['sha256'], url).exists():
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=60, stream=True)
+            if response.status_code == 304:
+                return url, 'unchanged', entry
+            if response.status_code != 200:
+                return url, 'error', f"HTTP {response.status_code}"
+
+            # Hash while streaming to a temp file, then move into place by digest
+            digest = hashlib.sha256()
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.objects_dir / f'.download-{hashlib.md5(url.encode()).hexdigest()}'
+            size = 0
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            object_path = self._object_path(sha256, url)
+            if object_path.exists():
+                tmp_path.unlink()
+            else:
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, object_path)
+
+            return url, 'downloaded', {
+                'sha256': sha256,
+                'size': size,
+                'path': object_path.relative_to(self.root).as_posix(),
+                'content_type': response.headers.get('Content-Type'),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+        except (requests.RequestException, OSError) as e:
+            return url, 'error', str(e)
+
+    def run(self):
+        """Mirror all referenced media; returns True if every file is mirrored"""
+        print("🖼️  Micro.blog Media Mirror")
+        print("=" * 60)
+        urls = self.collect_urls()
+        print(f"🔗 {len(urls)} media URLs referenced ({len(self.index)} already mirrored)")
+
+        counts = {'downloaded': 0, 'unchanged': 0, 'error': 0}
+        downloaded_bytes = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for url, status, result in pool.map(self.mirror_one, urls):
+                counts[status] += 1
+                if status == 'error':
+                    print(f"   ⚠️  {url}: {result}")
+                    continue
+                if status == 'downloaded':
+                    downloaded_bytes += result['size']
+                self.index[url] = result
+
+        self._save_index()
+
+        print()
+        print("=" * 60)
+        print(f"✅ Media mirror complete: {counts['downloaded']} downloaded "
+              f"({downloaded_bytes / 1024 / 1024:.2f}MB), {counts['unchanged']} unchanged (304), "
+              f"{counts['error']} failed")
+        return counts['error'] == 0
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Mirror uploaded photos into a content-addressed store')
+    parser.add_argument('--site-url', help=f'Site base URL (default: MICROBLOG_SITE_URL or {DEFAULT_SITE_URL})')
+    parser.add_argument('--backups-dir', default='backups', help='Backups directory (default: backups)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent downloads (default: 8)')
+
+    args = parser.parse_args()
+
+    mirror = MediaMirror(site_url=args.site_url, backups_dir=args.backups_dir, concurrency=args.concurrency)
+    sys.exit(0 if mirror.run() else 1)
+
+
+if __name__ == '__main__':
+    main()
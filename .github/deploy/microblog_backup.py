@@ -12,14 +12,30 @@ import re
 import requests
 import time
 import zipfile
+import zlib
+import json
 import shutil
+import subprocess
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from snapshot_store import SnapshotStore
+from parallel_zip import write_zip_parallel, zstd_available
+from backup_catalog import BackupCatalog, EXPORT, CONTENT_BACKUP, SNAPSHOT
+from archive_verify import verify as verify_zip
+from stream_zip import stream_extract, safe_relative_path
+from media_mirror import MediaMirror
+from export_latency import ExportLatencyModel
+from export_manifest import (find_theme_prefix, build_manifest, save_manifest, load_manifest,
+                             list_manifests, diff_manifests, print_diff)
 
 # Load environment variables
 load_dotenv()
 
+# Content validator shared with `just validate-meetings`
+VALIDATOR_SCRIPT = Path(__file__).resolve().parents[2] / 'scripts' / 'validate-meetings.py'
+
 
 class MicroblogBackup:
     def __init__(self, session_cookie=None):
@@ -57,6 +73,10 @@ class MicroblogBackup:
         # Create backups directory if it doesn't exist
         self.backups_dir = Path('backups')
         self.backups_dir.mkdir(exist_ok=True)
+        self.snapshots_dir = self.backups_dir / 'snapshots'
+        self.catalog_path = self.backups_dir / 'catalog.sqlite3'
+        self.manifests_dir = self.backups_dir / 'manifests'
+        self.latency_path = self.backups_dir / 'export-latency.json'
     
     def validate_session(self):
         """Test if session cookie is still valid"""
@@ -121,14 +141,25 @@ class MicroblogBackup:
             print(f"❌ Error connecting to Gmail: {e}")
             return None
     
-    def poll_email_for_export(self, export_time, max_retries=50, retry_interval=24):
+    def poll_email_for_export(self, export_time, max_retries=50, retry_interval=24, learned_schedule=True):
         """Poll Gmail for export ready notification and extract download link
         
         Default timeout: 50 retries × 24s = 20 minutes
         This handles slow Micro.blog export processing during high load.
+        
+        With learned_schedule, poll times come from the recorded trigger-to-email
+        latency of past exports: dense polling around the expected arrival,
+        sparse outside it, within the same total timeout.
         """
-        print(f"📧 Polling Gmail for export notification (up to {max_retries} retries, {retry_interval}s apart)...")
-        print(f"   Total timeout: {max_retries * retry_interval // 60} minutes")
+        latency_model = ExportLatencyModel(self.latency_path)
+        if learned_schedule:
+            waits = latency_model.schedule(max_retries=max_retries, retry_interval=retry_interval)
+            print(f"📧 Polling Gmail for export notification ({latency_model.describe()})...")
+        else:
+            waits = [60] + [retry_interval] * (max_retries - 1)
+            print(f"📧 Polling Gmail for export notification (up to {max_retries} retries, {retry_interval}s apart)...")
+        max_retries = len(waits)
+        print(f"   Total timeout: {sum(waits) // 60} minutes, {max_retries} polls")
         
         # Search emails from 10 minutes before export request (in case of clock skew)
         search_start = export_time - timedelta(minutes=10)
@@ -140,15 +171,14 @@ class MicroblogBackup:
         try:
             for attempt in range(1, max_retries + 1):
                 try:
-                    # Wait before checking (except first attempt)
+                    # Wait before checking
                     if attempt > 1:
-                        print(f"   ⏳ Waiting {retry_interval}s before retry {attempt}/{max_retries}...")
-                        time.sleep(retry_interval)
+                        print(f"   ⏳ Waiting {waits[attempt - 1]}s before retry {attempt}/{max_retries}...")
                     else:
                         # Longer initial delay to give Micro.blog time to process export
                         # Export typically takes 2-5 minutes, so wait before first poll
-                        print(f"   ⏳ Waiting 60s for initial export processing...")
-                        time.sleep(60)
+                        print(f"   ⏳ Waiting {waits[0]}s for initial export processing...")
+                    time.sleep(waits[attempt - 1])
                     
                     # Reconnect to IMAP every 10 attempts to prevent timeouts
                     if attempt > 1 and attempt % 10 == 1:
@@ -226,6 +256,7 @@ class MicroblogBackup:
                             if match:
                                 download_url = match.group(0)
                                 print(f"   🔗 Extracted download URL")
+                                self.record_export_latency(latency_model, export_time, message)
                                 return download_url
                             else:
                                 print(f"   ⚠️  No S3 download URL found in email")
@@ -248,6 +279,26 @@ class MicroblogBackup:
             except:
                 pass
     
+    def record_export_latency(self, latency_model, export_time, message):
+        """Record trigger-to-email latency, preferring the email's Date header over poll time"""
+        triggered = export_time.replace(tzinfo=timezone.utc)
+        arrived = datetime.now(timezone.utc)
+        try:
+            arrived = min(arrived, email.utils.parsedate_to_datetime(message.get('Date', '')))
+        except (TypeError, ValueError):
+            pass
+        
+        latency = (arrived - triggered).total_seconds()
+        # An older export email (or clock skew) would poison the model
+        if latency <= 0:
+            return
+        
+        try:
+            latency_model.record(latency)
+            print(f"   ⏱️  Export latency: {latency:.0f}s (recorded in {self.latency_path})")
+        except OSError as e:
+            print(f"   ⚠️  Could not record export latency: {e}")
+    
     def download_export_zip(self, download_url):
         """Download theme export ZIP from S3"""
         print(f"⬇️  Downloading theme export from S3...")
@@ -281,6 +332,8 @@ class MicroblogBackup:
                 file_size = output_path.stat().st_size / 1024 / 1024
                 print(f"✅ Theme export downloaded: {output_path}")
                 print(f"   Size: {file_size:.2f}MB")
+                self.catalog_archive(output_path, EXPORT)
+                self.record_export_manifest(output_path)
                 return output_path
             else:
                 print(f"❌ Failed to download export: {response.status_code}")
@@ -290,8 +343,318 @@ class MicroblogBackup:
             print(f"❌ Error downloading export: {e}")
             return None
     
-    def backup_existing_content(self):
-        """Create timestamped backup of current content directory"""
+    def snapshot_existing_content(self):
+        """Snapshot current content directory into the deduplicating snapshot store"""
+        content_dir = Path('content')
+        
+        if not content_dir.exists():
+            print("ℹ️  No existing content directory to snapshot")
+            return None
+        
+        print("💾 Snapshotting existing content directory...")
+        
+        try:
+            store = SnapshotStore(self.snapshots_dir)
+            snapshot_id, stats = store.snapshot(content_dir)
+            
+            print(f"✅ Content snapshot created: {snapshot_id}")
+            print(f"   Files: {stats['files']}, Rehashed: {stats['rehashed']}, "
+                  f"New blobs: {stats['new_blobs']} ({stats['new_bytes'] / 1024:.2f}KB)")
+            self.catalog_archive(store.manifests_dir / f'{snapshot_id}.json', SNAPSHOT,
+                                 manifest=store.load_manifest(snapshot_id))
+            return snapshot_id
+            
+        except Exception as e:
+            print(f"⚠️  Error creating content snapshot: {e}")
+            return None
+    
+    def catalog_archive(self, archive_path, kind, manifest=None):
+        """Record an archive or snapshot in the backup catalog (never fails the backup)"""
+        try:
+            with BackupCatalog(self.catalog_path) as catalog:
+                if kind == SNAPSHOT:
+                    catalog.add_snapshot(manifest, archive_path)
+                else:
+                    catalog.add_zip(archive_path, kind)
+            print(f"   📇 Cataloged in {self.catalog_path}")
+        except Exception as e:
+            print(f"   ⚠️  Could not catalog {archive_path}: {e}")
+    
+    def record_export_manifest(self, zip_path):
+        """Save a central-directory manifest for an export and summarize changes since the last one"""
+        try:
+            previous = [p for p in list_manifests(self.manifests_dir) if p.stem != Path(zip_path).stem]
+            manifest = build_manifest(zip_path)
+            manifest_path = save_manifest(manifest, self.manifests_dir)
+            print(f"   🧾 Manifest saved: {manifest_path} ({len(manifest['files'])} files)")
+            
+            if previous:
+                old = load_manifest(previous[-1])
+                print_diff(old, manifest, diff_manifests(old, manifest), verbose=False)
+            return manifest_path
+        except Exception as e:
+            print(f"   ⚠️  Could not build export manifest: {e}")
+            return None
+    
+    def validate_export(self, export_path):
+        """Validate export content before it touches the workspace
+        
+        A ZIP is validated in place (content/**/*.md read straight from the
+        archive); a streamed staging directory has its whole content/ tree
+        validated on disk, so both paths apply the same checks.
+        Returns True if the export may be extracted.
+        """
+        if not VALIDATOR_SCRIPT.exists():
+            print(f"⚠️  Validator not found at {VALIDATOR_SCRIPT}, skipping content validation")
+            return True
+        
+        export_path = Path(export_path)
+        if export_path.is_dir():
+            content_dir = export_path / 'content'
+            if not content_dir.exists():
+                print("ℹ️  No content/ in export, skipping content validation")
+                return True
+            args = ['--content-dir', str(content_dir)]
+        else:
+            args = ['--zip', str(export_path)]
+        
+        print(f"🔍 Validating export content before extraction...")
+        result = subprocess.run([sys.executable, str(VALIDATOR_SCRIPT), *args])
+        if result.returncode != 0:
+            print(f"❌ Export failed validation - workspace left untouched")
+            return False
+        return True
+    
+    def verify_archive(self, zip_path, drill=False):
+        """CRC-check an archive (optionally with a timed restore drill) and log the result"""
+        return verify_zip(zip_path, drill=drill, history_path=self.backups_dir / 'verify-history.jsonl')
+    
+    def apply_retention(self, keep_last=None, keep_days=None):
+        """Prune old archives and snapshots according to the retention policy"""
+        if keep_last is None and keep_days is None:
+            return []
+        
+        print(f"🧹 Applying retention (keep last: {keep_last}, keep days: {keep_days})...")
+        
+        try:
+            with BackupCatalog(self.catalog_path) as catalog:
+                pruned = catalog.prune(keep_last=keep_last, keep_days=keep_days)
+            
+            for row in pruned:
+                print(f"   🗑️  Pruned {row['kind']} {row['name']}")
+            
+            if any(row['kind'] == SNAPSHOT for row in pruned):
+                removed, freed = SnapshotStore(self.snapshots_dir).gc()
+                print(f"   🗑️  Removed {removed} unreferenced blobs ({freed / 1024:.2f}KB)")
+            
+            print(f"✅ Retention applied ({len(pruned)} archive(s) pruned)")
+            return pruned
+            
+        except Exception as e:
+            print(f"⚠️  Error applying retention: {e}")
+            return []
+    
+    def list_snapshots(self):
+        """Print snapshots available in the snapshot store"""
+        store = SnapshotStore(self.snapshots_dir)
+        snapshots = store.list_snapshots()
+        
+        if not snapshots:
+            print("ℹ️  No content snapshots found")
+            return snapshots
+        
+        print(f"📚 {len(snapshots)} content snapshot(s) in {self.snapshots_dir}:")
+        for snapshot_id in snapshots:
+            manifest = store.load_manifest(snapshot_id)
+            total_size = sum(meta['size'] for meta in manifest['files'].values())
+            print(f"   {snapshot_id}  {len(manifest['files'])} files, {total_size / 1024:.2f}KB")
+        return snapshots
+    
+    def restore_snapshot(self, snapshot_id):
+        """Rebuild the content directory from a snapshot"""
+        print(f"♻️  Restoring content snapshot {snapshot_id}...")
+        
+        try:
+            store = SnapshotStore(self.snapshots_dir)
+            restored = store.restore(snapshot_id, Path.cwd())
+            if restored is None:
+                print(f"❌ Snapshot not found: {snapshot_id}")
+                return False
+            
+            print(f"✅ Restored {restored} files from snapshot {snapshot_id}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error restoring snapshot: {e}")
+            return False
+    
+    def stream_export(self, download_url, extract_all=True, keep_archive=False):
+        """Stream the S3 export straight into a staging directory
+        
+        Local file headers are parsed as bytes arrive, and content/, data/
+        (plus layouts/ and static/ with extract_all) members are written to
+        backups/stream_staging without an on-disk ZIP. With keep_archive the
+        bytes are also teed to backups/<filename> for archiving.
+        Returns the staging directory, or None on failure.
+        """
+        print(f"⬇️  Streaming theme export from S3 into staging...")
+        
+        dirs_to_extract = ['content', 'data', 'layouts', 'static'] if extract_all else ['content', 'data']
+        staging_dir = self.backups_dir / 'stream_staging'
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        staging_dir.mkdir()
+        
+        archive_path = self.backups_dir / download_url.split('/')[-1] if keep_archive else None
+        tee = None
+        
+        try:
+            response = requests.get(download_url, timeout=300, stream=True)
+            if response.status_code != 200:
+                print(f"❌ Failed to download export: {response.status_code}")
+                shutil.rmtree(staging_dir)
+                return None
+            
+            if archive_path:
+                tee = open(archive_path, 'wb')
+            
+            start = time.time()
+            stats = stream_extract(response.iter_content(chunk_size=65536), staging_dir, dirs_to_extract, tee=tee)
+            elapsed = time.time() - start
+            
+            if tee:
+                tee.close()
+                tee = None
+            
+            print(f"✅ Streamed {stats['written']} of {stats['members']} members "
+                  f"({stats['bytes'] / 1024 / 1024:.2f}MB) in {elapsed:.1f}s")
+            
+            if archive_path:
+                print(f"   💾 Archive kept: {archive_path}")
+                self.catalog_archive(archive_path, EXPORT)
+                self.record_export_manifest(archive_path)
+            
+            return staging_dir
+            
+        except Exception as e:
+            print(f"❌ Error streaming export: {e}")
+            if tee:
+                tee.close()
+            if archive_path and archive_path.exists():
+                archive_path.unlink()
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+    
+    def install_staged(self, staging_dir, extract_all=True, incremental=False):
+        """Move directories from a staging directory into the workspace
+        
+        With incremental=True the workspace is synced instead, as
+        extract_content_incremental does for a ZIP: staged files whose size
+        and CRC32 match the workspace copy are left alone, new or changed ones
+        are moved in and files the export no longer has are deleted.
+        """
+        if incremental:
+            return self.install_staged_incremental(staging_dir, extract_all=extract_all) is not None
+        
+        print(f"📂 Installing streamed content into workspace...")
+        
+        dirs_to_extract = ['content', 'data', 'layouts', 'static'] if extract_all else ['content', 'data']
+        workspace_root = Path.cwd()
+        installed = 0
+        
+        try:
+            for dir_name in dirs_to_extract:
+                source_dir = staging_dir / dir_name
+                if not source_dir.exists():
+                    print(f"   ⚠️  {dir_name}/ not found in theme export")
+                    continue
+                
+                dest_dir = workspace_root / dir_name
+                if dest_dir.exists():
+                    print(f"   🗑️  Removing existing {dir_name}/")
+                    shutil.rmtree(dest_dir)
+                
+                shutil.move(str(source_dir), str(dest_dir))
+                file_count = sum(1 for _ in dest_dir.rglob('*') if _.is_file())
+                print(f"   ✅ {dir_name}/ installed ({file_count} files)")
+                installed += 1
+            
+            shutil.rmtree(staging_dir)
+            print(f"✅ Content installation complete ({installed} directories)")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error installing streamed content: {e}")
+            return False
+    
+    def install_staged_incremental(self, staging_dir, extract_all=True, report_path=None):
+        """Sync workspace directories with a streamed staging directory, touching only changed files
+        
+        Returns the change report dict (as extract_content_incremental does), or None on failure.
+        """
+        print(f"📂 Incrementally installing streamed content into workspace...")
+        
+        dirs_to_extract = ['content', 'data', 'layouts', 'static'] if extract_all else ['content', 'data']
+        workspace_root = Path.cwd()
+        report = {
+            'archive': str(staging_dir),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'added': [],
+            'modified': [],
+            'removed': [],
+            'unchanged': 0,
+        }
+        
+        try:
+            for dir_name in dirs_to_extract:
+                source_dir = staging_dir / dir_name
+                if not source_dir.exists():
+                    print(f"   ⚠️  {dir_name}/ not found in theme export")
+                    continue
+                
+                counts = {'added': 0, 'modified': 0, 'removed': 0}
+                staged = {}
+                for source in sorted(source_dir.rglob('*')):
+                    if source.is_file():
+                        staged[source.relative_to(staging_dir).as_posix()] = source
+                
+                for rel_path, source in staged.items():
+                    dest = workspace_root / rel_path
+                    if dest.is_file():
+                        if (dest.stat().st_size == source.stat().st_size
+                                and self._file_crc32(dest) == self._file_crc32(source)):
+                            report['unchanged'] += 1
+                            continue
+                        change = 'modified'
+                    else:
+                        change = 'added'
+                    
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.move(str(source), str(dest))
+                    report[change].append(rel_path)
+                    counts[change] += 1
+                
+                self._remove_missing(workspace_root / dir_name, staged, workspace_root, report, counts)
+                print(f"   ✅ {dir_name}/ synced "
+                      f"(+{counts['added']} ~{counts['modified']} -{counts['removed']})")
+            
+            shutil.rmtree(staging_dir)
+            self._save_change_report(report, report_path)
+            return report
+            
+        except Exception as e:
+            print(f"❌ Error installing streamed content: {e}")
+            return None
+    
+    def backup_existing_content(self, use_snapshot_store=False, compression='deflate', workers=None):
+        """Create timestamped backup of current content directory
+        
+        Members are compressed in a process pool: media that is already compressed
+        is stored as-is, text uses deflate (or zstd when requested and available).
+        """
+        if use_snapshot_store:
+            return self.snapshot_existing_content()
+        
         content_dir = Path('content')
         
         if not content_dir.exists():
@@ -300,30 +663,169 @@ class MicroblogBackup:
         
         print("💾 Backing up existing content directory...")
         
+        if compression == 'zstd' and not zstd_available():
+            print("   ⚠️  zstd not available (needs Python 3.14+ or the zstandard package), using deflate")
+            compression = 'deflate'
+        
         timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
         backup_filename = f'content-backup-{timestamp}.zip'
         backup_path = self.backups_dir / backup_filename
         
         try:
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                file_count = 0
-                for file_path in content_dir.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(content_dir.parent)
-                        zipf.write(file_path, arcname)
-                        file_count += 1
+            files = [(file_path, file_path.relative_to(content_dir.parent).as_posix())
+                     for file_path in sorted(content_dir.rglob('*')) if file_path.is_file()]
+            stats = write_zip_parallel(files, backup_path, text_method=compression, workers=workers)
             
             file_size = backup_path.stat().st_size / 1024
             print(f"✅ Content backup created: {backup_path}")
-            print(f"   Files: {file_count}, Size: {file_size:.2f}KB")
+            print(f"   Files: {stats['files']} ({stats['compressed']} {compression}, {stats['stored']} stored), "
+                  f"Size: {file_size:.2f}KB")
+            self.catalog_archive(backup_path, CONTENT_BACKUP)
             return backup_path
             
         except Exception as e:
             print(f"⚠️  Error creating content backup: {e}")
             return None
     
-    def extract_content(self, zip_path, extract_all=True):
+    @staticmethod
+    def _file_crc32(path, chunk_size=65536):
+        """Compute the CRC32 of a file on disk, matching zipfile's ZipInfo.CRC"""
+        crc = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                crc = zlib.crc32(chunk, crc)
+        return crc & 0xFFFFFFFF
+    
+    def _remove_missing(self, dest_dir, keep, workspace_root, report, counts):
+        """Delete files under dest_dir whose workspace-relative path isn't in keep, then empty directories"""
+        if not dest_dir.exists():
+            return
+        for file_path in sorted(dest_dir.rglob('*')):
+            if not file_path.is_file():
+                continue
+            rel_path = file_path.relative_to(workspace_root).as_posix()
+            if rel_path not in keep:
+                file_path.unlink()
+                report['removed'].append(rel_path)
+                counts['removed'] += 1
+        
+        # Prune directories emptied by removals (deepest first)
+        for sub_dir in sorted((d for d in dest_dir.rglob('*') if d.is_dir()),
+                              key=lambda d: len(d.parts), reverse=True):
+            if not any(sub_dir.iterdir()):
+                sub_dir.rmdir()
+    
+    def _save_change_report(self, report, report_path=None):
+        """Write an incremental sync's change report to backups/ and print its summary"""
+        if report_path is None:
+            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            report_path = self.backups_dir / f'extract-report-{timestamp}.json'
+        Path(report_path).write_text(json.dumps(report, indent=2) + '\n')
+        
+        changed = len(report['added']) + len(report['modified']) + len(report['removed'])
+        print(f"✅ Incremental extraction complete ({changed} changed, {report['unchanged']} unchanged)")
+        print(f"   Added: {len(report['added'])}, Modified: {len(report['modified'])}, "
+              f"Removed: {len(report['removed'])}")
+        print(f"   Change report: {report_path}")
+    
+    def extract_content_incremental(self, zip_path, extract_all=True, report_path=None):
+        """Sync workspace directories with the theme export, touching only changed files
+        
+        Each archive member's CRC32 and size (read from the ZIP central directory)
+        are compared against the workspace copy. New or modified files are written,
+        files no longer in the export are deleted, and everything else is left alone.
+        Returns the change report dict, or None on failure.
+        """
+        print(f"📂 Incrementally extracting content from theme export...")
+        
+        if not zip_path.exists():
+            print(f"❌ ZIP file not found: {zip_path}")
+            return None
+        
+        if extract_all:
+            dirs_to_extract = ['content', 'data', 'layouts', 'static']
+        else:
+            dirs_to_extract = ['content', 'data']
+        
+        workspace_root = Path.cwd()
+        report = {
+            'archive': str(zip_path),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'added': [],
+            'modified': [],
+            'removed': [],
+            'unchanged': 0,
+        }
+        
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zipf:
+                infos = [info for info in zipf.infolist()
+                         if not info.is_dir()
+                         and not info.filename.startswith('__MACOSX/')
+                         and not Path(info.filename).name.startswith('._')]
+                prefix = find_theme_prefix([info.filename for info in infos])
+                if prefix is None:
+                    print(f"❌ No theme directory found in ZIP")
+                    return None
+                print(f"   📁 Theme structure: {'root level' if not prefix else prefix.rstrip('/')}")
+                
+                for dir_name in dirs_to_extract:
+                    dir_prefix = f'{prefix}{dir_name}/'
+                    members = {}
+                    for info in infos:
+                        if not info.filename.startswith(dir_prefix):
+                            continue
+                        # Reject absolute and .. member names, as extractall would
+                        rel_path = safe_relative_path(info.filename[len(prefix):])
+                        if rel_path is None:
+                            print(f"   ⚠️  Skipping unsafe member name: {info.filename}")
+                            continue
+                        members[rel_path.as_posix()] = info
+                    if not members:
+                        print(f"   ⚠️  {dir_name}/ not found in theme export")
+                        continue
+                    
+                    counts = {'added': 0, 'modified': 0, 'removed': 0}
+                    dest_root = (workspace_root / dir_name).resolve()
+                    
+                    for rel_path, info in sorted(members.items()):
+                        dest = workspace_root / rel_path
+                        if not dest.resolve().is_relative_to(dest_root):
+                            print(f"   ⚠️  Skipping member outside {dir_name}/: {info.filename}")
+                            continue
+                        if dest.is_file():
+                            if (dest.stat().st_size == info.file_size
+                                    and self._file_crc32(dest) == info.CRC):
+                                report['unchanged'] += 1
+                                continue
+                            change = 'modified'
+                        else:
+                            change = 'added'
+                        
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        with zipf.open(info) as src, open(dest, 'wb') as dst:
+                            shutil.copyfileobj(src, dst)
+                        report[change].append(rel_path)
+                        counts[change] += 1
+                    
+                    self._remove_missing(workspace_root / dir_name, members, workspace_root, report, counts)
+                    print(f"   ✅ {dir_name}/ synced "
+                          f"(+{counts['added']} ~{counts['modified']} -{counts['removed']})")
+            
+            self._save_change_report(report, report_path)
+            return report
+            
+        except Exception as e:
+            print(f"❌ Error extracting content: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    def extract_content(self, zip_path, extract_all=True, incremental=False):
         """Extract content from theme export ZIP to workspace"""
+        if incremental:
+            return self.extract_content_incremental(zip_path, extract_all=extract_all) is not None
+        
         print(f"📂 Extracting content from theme export...")
         
         if not zip_path.exists():
@@ -407,8 +909,90 @@ class MicroblogBackup:
                 shutil.rmtree(temp_dir)
             return False
     
-    def backup(self, export=True, download=True, extract=True, backup_existing=True, max_retries=50, retry_interval=24):
-        """Execute full backup sequence"""
+    def fetch_export(self, export_time, max_retries=50, retry_interval=24, verify=False, learned_schedule=True,
+                     stream=False, keep_archive=True):
+        """Wait for the export email, download the archive and optionally verify it
+        
+        Returns the downloaded ZIP path, or None if any step failed. With
+        stream=True the export is extracted into a staging directory while it
+        downloads and that directory is returned instead.
+        """
+        # Step 2: Poll email for download link
+        print()
+        download_url = self.poll_email_for_export(export_time, max_retries=max_retries, retry_interval=retry_interval,
+                                                  learned_schedule=learned_schedule)
+        if not download_url:
+            return None
+        
+        # Step 3: Download export
+        print()
+        if stream:
+            staging_dir = self.stream_export(download_url, keep_archive=keep_archive)
+            if staging_dir and verify and keep_archive:
+                print()
+                archive_path = self.backups_dir / download_url.split('/')[-1]
+                if not self.verify_archive(archive_path):
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    return None
+            return staging_dir
+        
+        export_zip_path = self.download_export_zip(download_url)
+        if not export_zip_path:
+            return None
+        
+        # Step 3b: Prove the archive reads back before relying on it
+        if verify:
+            print()
+            if not self.verify_archive(export_zip_path, drill=True):
+                return None
+        
+        return export_zip_path
+    
+    def previous_export(self):
+        """Return the most recent export ZIP already in the backups directory"""
+        exports = [p for p in self.backups_dir.glob('*.zip') if not p.name.startswith('content-backup-')]
+        return max(exports, key=lambda p: p.stat().st_mtime) if exports else None
+    
+    def prepare_local(self, backup_existing=True, use_snapshot_store=False, compression='deflate',
+                      workers=None, verify=False, previous_export=None):
+        """Local work that does not depend on the new export
+        
+        Snapshots the current content, verifies and catalogs the previous
+        export, and clears a stale staging directory. Run while the export
+        is still being generated remotely.
+        """
+        if backup_existing:
+            print()
+            content_backup = self.backup_existing_content(use_snapshot_store=use_snapshot_store,
+                                                          compression=compression, workers=workers)
+            if verify and content_backup and not use_snapshot_store:
+                self.verify_archive(content_backup)
+        
+        if previous_export:
+            print()
+            print(f"📦 Checking previous export: {previous_export.name}")
+            if verify:
+                self.verify_archive(previous_export)
+            self.catalog_archive(previous_export, EXPORT)
+        
+        temp_dir = self.backups_dir / 'temp_extract'
+        if temp_dir.exists():
+            print(f"🧹 Removing stale staging directory {temp_dir}")
+            shutil.rmtree(temp_dir)
+    
+    def backup(self, export=True, download=True, extract=True, backup_existing=True, max_retries=50, retry_interval=24,
+               incremental=False, use_snapshot_store=False, compression='deflate', workers=None,
+               keep_last=None, keep_days=None, verify=False, pipeline=False, learned_schedule=True,
+               stream=False, keep_archive=True, validate=True, mirror_media=False):
+        """Execute full backup sequence
+        
+        With pipeline=True, local work (content snapshot, checking the previous
+        export, staging cleanup) runs while waiting for the export email, so
+        total time is bounded by the remote wait rather than the sum of steps.
+        
+        With stream=True (and extract), the export is extracted while it
+        downloads; keep_archive controls whether the ZIP is also saved.
+        """
         print("🚀 Micro.blog Backup")
         print("=" * 60)
         
@@ -420,6 +1004,9 @@ class MicroblogBackup:
         
         success = True
         export_zip_path = None
+        staged_dir = None
+        local_done = False
+        stream = stream and extract
         
         # Step 1: Trigger export
         if export:
@@ -429,33 +1016,77 @@ class MicroblogBackup:
                 success = False
                 export = False  # Skip dependent steps
             
-            # Step 2: Poll email for download link
+            # Steps 2-3: Wait for the export email and download it
             if download and export_time:
-                print()
-                download_url = self.poll_email_for_export(export_time, max_retries=max_retries, retry_interval=retry_interval)
-                if not download_url:
-                    success = False
-                    download = False
-                
-                # Step 3: Download export
-                if download_url:
+                if pipeline:
+                    previous_export = self.previous_export()
                     print()
-                    export_zip_path = self.download_export_zip(download_url)
-                    if not export_zip_path:
-                        success = False
-                        extract = False
+                    print("🔀 Pipelined mode: running local steps while the export is prepared")
+                    with ThreadPoolExecutor(max_workers=1) as pool:
+                        pending = pool.submit(self.fetch_export, export_time, max_retries=max_retries,
+                                              retry_interval=retry_interval, verify=verify,
+                                              learned_schedule=learned_schedule,
+                                              stream=stream, keep_archive=keep_archive)
+                        self.prepare_local(backup_existing=backup_existing and extract,
+                                           use_snapshot_store=use_snapshot_store, compression=compression,
+                                           workers=workers, verify=verify, previous_export=previous_export)
+                        local_done = True
+                        export_zip_path = pending.result()
+                else:
+                    export_zip_path = self.fetch_export(export_time, max_retries=max_retries,
+                                                        retry_interval=retry_interval, verify=verify,
+                                                        learned_schedule=learned_schedule,
+                                                        stream=stream, keep_archive=keep_archive)
+                
+                if not export_zip_path:
+                    success = False
+                    extract = False
+                elif stream:
+                    staged_dir = export_zip_path
+                    export_zip_path = None
+        
+        # Step 3c: Reject a malformed export before anything touches the workspace
+        if validate and extract and (export_zip_path or staged_dir):
+            print()
+            if not self.validate_export(export_zip_path or staged_dir):
+                success = False
+                extract = False
+                if staged_dir:
+                    shutil.rmtree(staged_dir, ignore_errors=True)
         
         # Step 4: Backup existing content
-        if backup_existing and extract:
+        if backup_existing and extract and not local_done:
             print()
-            self.backup_existing_content()
+            content_backup = self.backup_existing_content(use_snapshot_store=use_snapshot_store,
+                                                          compression=compression, workers=workers)
+            if verify and content_backup and not use_snapshot_store:
+                self.verify_archive(content_backup)
         
         # Step 5: Extract content
-        if extract and export_zip_path:
+        if extract and staged_dir:
+            print()
+            if not self.install_staged(staged_dir, incremental=incremental):
+                success = False
+        elif extract and export_zip_path:
             print()
-            if not self.extract_content(export_zip_path):
+            if not self.extract_content(export_zip_path, incremental=incremental):
                 success = False
         
+        # Step 5b: Mirror uploaded photos the export may not include
+        if mirror_media:
+            print()
+            try:
+                if not MediaMirror(backups_dir=self.backups_dir).run():
+                    success = False
+            except Exception as e:
+                print(f"⚠️  Error mirroring media: {e}")
+                success = False
+        
+        # Step 6: Prune old archives
+        if keep_last is not None or keep_days is not None:
+            print()
+            self.apply_retention(keep_last=keep_last, keep_days=keep_days)
+        
         print()
         print("=" * 60)
         if success:
@@ -477,6 +1108,34 @@ def main():
     parser.add_argument('--extract-only', help='Extract content from existing ZIP file')
     parser.add_argument('--all', action='store_true', help='Run full backup (export + download + extract)')
     parser.add_argument('--no-backup', action='store_true', help='Skip backing up existing content before extraction')
+    parser.add_argument('--snapshot', action='store_true',
+                       help='Back up existing content into the deduplicating snapshot store instead of a ZIP')
+    parser.add_argument('--compression', choices=['deflate', 'zstd'], default='deflate',
+                       help='Compression for text files in content backup ZIPs; media is always stored (default: deflate)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Worker processes for content backup compression (default: CPU count)')
+    parser.add_argument('--keep-last', type=int, default=None,
+                       help='Retention: keep the newest N archives of each kind (exports, content backups, snapshots)')
+    parser.add_argument('--keep-days', type=int, default=None,
+                       help='Retention: keep archives younger than N days')
+    parser.add_argument('--verify', action='store_true',
+                       help='CRC-check downloaded exports (with a timed restore drill) and content backups')
+    parser.add_argument('--pipeline', action='store_true',
+                       help='Run local snapshot, previous-archive checks and staging cleanup while waiting for the export')
+    parser.add_argument('--stream', action='store_true',
+                       help='Extract the export while it downloads instead of saving and re-reading a ZIP (with --all)')
+    parser.add_argument('--no-keep-archive', action='store_true',
+                       help='With --stream, do not also save the export ZIP to backups/')
+    parser.add_argument('--skip-validation', action='store_true',
+                       help='Extract even if the export fails content validation')
+    parser.add_argument('--mirror-media', action='store_true',
+                       help='Also mirror photos referenced by photos/index.json and posts into backups/media')
+    parser.add_argument('--list-snapshots', action='store_true', help='List content snapshots')
+    parser.add_argument('--restore-snapshot', metavar='SNAPSHOT_ID', help='Rebuild content/ from a snapshot')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only write new/changed files and delete removed ones (compares CRC32 and size)')
+    parser.add_argument('--fixed-schedule', action='store_true',
+                       help='Poll on the fixed retry interval instead of the schedule learned from past export latency')
     parser.add_argument('--max-retries', type=int, default=50,
                        help='Maximum number of email polling attempts (default: 50)')
     parser.add_argument('--retry-interval', type=int, default=24,
@@ -485,15 +1144,30 @@ def main():
     args = parser.parse_args()
     
     # If no specific action specified, show help
-    if not any([args.export_only, args.extract_only, args.all]):
+    if not any([args.export_only, args.extract_only, args.all, args.list_snapshots, args.restore_snapshot]):
         parser.print_help()
         print("\nExamples:")
         print("  python3 microblog_backup.py --all                    # Full backup with extraction")
         print("  python3 microblog_backup.py --export-only            # Export and download only")
         print("  python3 microblog_backup.py --extract-only backup.zip  # Extract from existing ZIP")
+        print("  python3 microblog_backup.py --extract-only backup.zip --incremental  # Only apply changes")
+        print("  python3 microblog_backup.py --restore-snapshot 20250101-030000  # Rebuild content/ from a snapshot")
         sys.exit(1)
     
     try:
+        # Snapshot store management (no session cookie needed)
+        if args.list_snapshots or args.restore_snapshot:
+            backup = MicroblogBackup(session_cookie='dummy')
+            if args.list_snapshots:
+                backup.list_snapshots()
+                sys.exit(0)
+            
+            if not args.no_backup:
+                backup.snapshot_existing_content()
+                print()
+            success = backup.restore_snapshot(args.restore_snapshot)
+            sys.exit(0 if success else 1)
+        
         # Handle extract-only mode (no session cookie needed)
         if args.extract_only:
             # Create minimal backup instance just for extraction
@@ -510,12 +1184,21 @@ def main():
             print("🚀 Micro.blog Backup - Extract Only")
             print("=" * 60)
             
+            if not args.skip_validation:
+                print()
+                if not backup.validate_export(zip_path):
+                    sys.exit(1)
+            
             if not args.no_backup:
                 print()
-                backup.backup_existing_content()
+                backup.backup_existing_content(use_snapshot_store=args.snapshot,
+                                               compression=args.compression, workers=args.jobs)
             
             print()
-            success = backup.extract_content(zip_path)
+            success = backup.extract_content(zip_path, incremental=args.incremental)
+            if args.keep_last is not None or args.keep_days is not None:
+                print()
+                backup.apply_retention(keep_last=args.keep_last, keep_days=args.keep_days)
             print()
             print("=" * 60)
             if success:
@@ -535,7 +1218,20 @@ def main():
                 extract=True,
                 backup_existing=not args.no_backup,
                 max_retries=args.max_retries,
-                retry_interval=args.retry_interval
+                retry_interval=args.retry_interval,
+                incremental=args.incremental,
+                use_snapshot_store=args.snapshot,
+                compression=args.compression,
+                workers=args.jobs,
+                keep_last=args.keep_last,
+                keep_days=args.keep_days,
+                verify=args.verify,
+                pipeline=args.pipeline,
+                learned_schedule=not args.fixed_schedule,
+                stream=args.stream,
+                keep_archive=not args.no_keep_archive,
+                validate=not args.skip_validation,
+                mirror_media=args.mirror_media
             )
         elif args.export_only:
             success = backup.backup(
@@ -544,7 +1240,11 @@ def main():
                 extract=False,
                 backup_existing=False,
                 max_retries=args.max_retries,
-                retry_interval=args.retry_interval
+                retry_interval=args.retry_interval,
+                verify=args.verify,
+                pipeline=args.pipeline,
+                learned_schedule=not args.fixed_schedule,
+                mirror_media=args.mirror_media
             )
         else:
             success = True
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Parallel ZIP Writer
+Compresses archive members across a process pool, choosing a compression
+method per file type, then assembles the ZIP in a single sequential pass
+"""
+
+import os
+import time
+import zlib
+import struct
+import zipfile
+import multiprocessing
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# zstd is in the stdlib from Python 3.14; fall back to the zstandard package
+try:
+    from compression import zstd as _zstd
+
+    def _zstd_compress(data):
+        return _zstd.compress(data)
+
+    def _zstd_decompressobj():
+        return _zstd.ZstdDecompressor()
+except ImportError:
+    try:
+        import zstandard as _zstandard
+
+        def _zstd_compress(data):
+            return _zstandard.ZstdCompressor().compress(data)
+
+        def _zstd_decompressobj():
+            return _zstandard.ZstdDecompressor().decompressobj()
+    except ImportError:
+        _zstd_compress = None
+        _zstd_decompressobj = None
+
+ZIP_ZSTANDARD = 93  # APPNOTE 6.3.7 method ID (zipfile.ZIP_ZSTANDARD on 3.14+)
+
+# Formats that are already compressed; deflating them only burns CPU
+STORED_EXTENSIONS = {
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif', '.heic', '.ico',
+    '.woff', '.woff2', '.mp3', '.m4a', '.mp4', '.mov', '.webm',
+    '.zip', '.gz', '.bz2', '.xz', '.zst', '.pdf',
+}
+
+# Content backups can run while microblog_backup.py waits for the export email
+# on another thread, and forking a threaded process can deadlock the children
+# on locks that thread held; start workers from a clean process instead
+_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Members queued per worker ahead of the one being written; bounds how many
+# compressed payloads wait in memory behind a slow head-of-line file
+_WINDOW_PER_WORKER = 4
+COPY_CHUNK = 1024 * 1024
+
+# Classic ZIP limits; beyond these we hand off to zipfile, which writes ZIP64
+_MAX_ENTRIES = 0xFFFF
+_MAX_SIZE = 0xFFFFFFFF
+
+
+def zstd_available():
+    return _zstd_compress is not None
+
+
+def needs_zstd_reader(info):
+    """True for zstd members this Python's zipfile can't read (before 3.14)"""
+    return info.compress_type == ZIP_ZSTANDARD and not hasattr(zipfile, 'ZIP_ZSTANDARD')
+
+
+def iter_zstd_member(zip_path, info, chunk_size=1024 * 1024):
+    """Yield the decompressed data of a zstd member through the zstandard package
+
+    Used for archives written with the zstandard fallback, which zipfile can't
+    open before Python 3.14. Raises zipfile.BadZipFile on a truncated member
+    or a CRC/size mismatch, like reading through zipfile would, and
+    RuntimeError when neither zstd backend is installed.
+    """
+    if _zstd_decompressobj is None:
+        raise RuntimeError("zstd member needs Python 3.14+ or the zstandard package to read")
+
+    with open(zip_path, 'rb') as f:
+        f.seek(info.header_offset)
+        header = f.read(30)
+        if len(header) < 30 or header[:4] != b'PK\x03\x04':
+            raise zipfile.BadZipFile(f"Bad local header for {info.filename!r}")
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        f.seek(name_length + extra_length, os.SEEK_CUR)
+
+        decompressor = _zstd_decompressobj()
+        remaining = info.compress_size
+        crc = 0
+        size = 0
+        while remaining:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename!r}")
+            remaining -= len(chunk)
+            data = decompressor.decompress(chunk)
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+            yield data
+
+    if crc & 0xFFFFFFFF != info.CRC or size != info.file_size:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+
+
+def choose_method(path, text_method='deflate'):
+    """Pick the ZIP compression method for a file based on its extension"""
+    if Path(path).suffix.lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    if text_method == 'zstd' and zstd_available():
+        return ZIP_ZSTANDARD
+    return zipfile.ZIP_DEFLATED
+
+
+def _compress_member(task):
+    """Worker: read and compress one file, returning everything the header needs
+
+    Only compressible files come here; stored members are copied by the parent.
+    """
+    path, arcname, method = task
+    data = Path(path).read_bytes()
+    st = os.stat(path)
+    crc = zlib.crc32(data) & 0xFFFFFFFF
+
+    if method == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+    elif method == ZIP_ZSTANDARD:
+        payload = _zstd_compress(data)
+    else:
+        payload = data
+
+    # Keep the smaller encoding; tiny or random files often grow when compressed
+    if method != zipfile.ZIP_STORED and len(payload) >= len(data):
+        method, payload = zipfile.ZIP_STORED, data
+
+    return arcname, method, crc, len(data), payload, st.st_mtime, st.st_mode
+
+
+def _dos_datetime(mtime):
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (0 << 9) | (1 << 5) | 1
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+def _write_sequential(tasks, output_path):
+    """Fallback writer for archives that need ZIP64; keeps per-file methods"""
+    stats = {'files': 0, 'stored': 0, 'compressed': 0}
+    with zipfile.ZipFile(output_path, 'w', allowZip64=True) as zipf:
+        for path, arcname, method in tasks:
+            if method == ZIP_ZSTANDARD:
+                method = getattr(zipfile, 'ZIP_ZSTANDARD', zipfile.ZIP_DEFLATED)
+            zipf.write(path, arcname, compress_type=method)
+            stats['files'] += 1
+            stats['stored' if method == zipfile.ZIP_STORED else 'compressed'] += 1
+    return stats
+
+
+def _local_header(version, flags, method, dos_time, dos_date, crc, compress_size, size, name):
+    return struct.pack('<IHHHHHIIIHH', 0x04034B50, version, flags, method,
+                       dos_time, dos_date, crc, compress_size, size, len(name), 0) + name
+
+
+def _write_stored(out, path, header_fields, name):
+    """Copy a file into the archive in chunks, then patch its CRC and sizes into the header
+
+    Returns (crc, size). Already-compressed media never goes through the
+    pool, so it is read once and never held in memory whole.
+    """
+    header_offset = out.tell()
+    out.write(_local_header(*header_fields, 0, 0, 0, name))
+    crc = 0
+    size = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK), b''):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            out.write(chunk)
+    crc &= 0xFFFFFFFF
+    end = out.tell()
+    out.seek(header_offset + 14)
+    out.write(struct.pack('<III', crc, size, size))
+    out.seek(end)
+    return crc, size
+
+
+def write_zip_parallel(files, output_path, text_method='deflate', workers=None):
+    """Write (path, arcname) pairs to a ZIP, compressing members in parallel
+
+    Media is stored as-is and streamed straight into the archive; everything
+    else is compressed in the pool with deflate (or zstd when requested and
+    available). Returns a stats dict with file and method counts.
+    """
+    tasks = [(str(path), str(arcname), choose_method(path, text_method)) for path, arcname in files]
+
+    total_size = sum(os.path.getsize(path) for path, _, _ in tasks)
+    if len(tasks) >= _MAX_ENTRIES or total_size >= _MAX_SIZE:
+        return _write_sequential(tasks, output_path)
+
+    stats = {'files': 0, 'stored': 0, 'compressed': 0}
+    central_directory = []
+    window = (workers or os.cpu_count() or 1) * _WINDOW_PER_WORKER
+
+    def write_member(out, task, future):
+        path, arcname, method = task
+        name = arcname.encode('utf-8')
+        flags = 0x800 if not arcname.isascii() else 0
+        offset = out.tell()
+
+        if future is None:
+            st = os.stat(path)
+            version = 20
+            dos_time, dos_date = _dos_datetime(st.st_mtime)
+            crc, size = _write_stored(out, path, (version, flags, method, dos_time, dos_date), name)
+            compress_size, mode = size, st.st_mode
+        else:
+            _, method, crc, size, payload, mtime, mode = future.result()
+            version = 63 if method == ZIP_ZSTANDARD else 20
+            dos_time, dos_date = _dos_datetime(mtime)
+            out.write(_local_header(version, flags, method, dos_time, dos_date, crc, len(payload), size, name))
+            out.write(payload)
+            compress_size = len(payload)
+
+        central_directory.append(struct.pack(
+            '<IHHHHHHIIIHHHHHII', 0x02014B50, (3 << 8) | version, version, flags, method,
+            dos_time, dos_date, crc, compress_size, size, len(name), 0, 0, 0, 0,
+            (mode & 0xFFFF) << 16, offset) + name)
+
+        stats['files'] += 1
+        stats['stored' if method == zipfile.ZIP_STORED else 'compressed'] += 1
+
+    with open(output_path, 'wb') as out, ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(_START_METHOD)) as pool:
+        # Members are written in task order, so the archive layout is deterministic;
+        # at most `window` of them are in flight ahead of the one being written
+        pending = deque()
+        for task in tasks:
+            future = pool.submit(_compress_member, task) if task[2] != zipfile.ZIP_STORED else None
+            pending.append((task, future))
+            if len(pending) >= window:
+                write_member(out, *pending.popleft())
+        while pending:
+            write_member(out, *pending.popleft())
+
+        cd_offset = out.tell()
+        for record in central_directory:
+            out.write(record)
+        cd_size = out.tell() - cd_offset
+        out.write(struct.pack('<IHHHHIIH', 0x06054B50, 0, 0, len(central_directory),
+                              len(central_directory), cd_size, cd_offset, 0))
+
+    return stats
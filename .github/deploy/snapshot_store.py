@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Snapshot Store
+Deduplicating backups of the content directory: file blobs keyed by SHA-256,
+plus one small JSON manifest per snapshot
+"""
+
+import os
+import json
+import hashlib
+import shutil
+from pathlib import Path
+from datetime import datetime
+
+
+class SnapshotStore:
+    """Snapshot store laid out as:
+
+        <root>/objects/ab/cdef...   file blobs keyed by SHA-256
+        <root>/manifests/<id>.json  path -> {sha256, size, mtime} per snapshot
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.manifests_dir = self.root / 'manifests'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _hash_file(path, chunk_size=65536):
+        """SHA-256 hex digest of a file"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _object_path(self, sha256):
+        return self.objects_dir / sha256[:2] / sha256[2:]
+
+    def _store_blob(self, file_path, sha256):
+        """Copy a file into the object store unless the blob already exists"""
+        blob_path = self._object_path(sha256)
+        if blob_path.exists():
+            return False
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(f'.{blob_path.name}.tmp')
+        shutil.copyfile(file_path, tmp_path)
+        os.replace(tmp_path, blob_path)
+        return True
+
+    def list_snapshots(self):
+        """Return snapshot IDs, oldest first"""
+        return sorted(p.stem for p in self.manifests_dir.glob('*.json'))
+
+    def load_manifest(self, snapshot_id):
+        manifest_path = self.manifests_dir / f'{snapshot_id}.json'
+        if not manifest_path.exists():
+            return None
+        return json.loads(manifest_path.read_text())
+
+    def latest_manifest(self):
+        snapshots = self.list_snapshots()
+        return self.load_manifest(snapshots[-1]) if snapshots else None
+
+    def snapshot(self, source_dir, snapshot_id=None):
+        """Snapshot a directory tree, storing only blobs not already present
+
+        Files whose size and mtime match the previous snapshot reuse its hash
+        without being re-read, so an unchanged tree costs one stat per file.
+        Returns (snapshot_id, stats) where stats counts files and new blobs.
+        """
+        source_dir = Path(source_dir)
+        snapshot_id = snapshot_id or datetime.now().strftime('%Y%m%d-%H%M%S')
+
+        previous = self.latest_manifest()
+        previous_files = previous['files'] if previous else {}
+
+        files = {}
+        stats = {'files': 0, 'new_blobs': 0, 'new_bytes': 0, 'rehashed': 0}
+
+        for file_path in sorted(source_dir.rglob('*')):
+            if not file_path.is_file():
+                continue
+
+            rel_path = file_path.relative_to(source_dir.parent).as_posix()
+            st = file_path.stat()
+            prior = previous_files.get(rel_path)
+
+            if (prior and prior['size'] == st.st_size and prior['mtime'] == st.st_mtime_ns
+                    and self._object_path(prior['sha256']).exists()):
+                sha256 = prior['sha256']
+            else:
+                sha256 = self._hash_file(file_path)
+                stats['rehashed'] += 1
+                if self._store_blob(file_path, sha256):
+                    stats['new_blobs'] += 1
+                    stats['new_bytes'] += st.st_size
+
+            files[rel_path] = {'sha256': sha256, 'size': st.st_size, 'mtime': st.st_mtime_ns}
+            stats['files'] += 1
+
+        manifest = {
+            'id': snapshot_id,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': source_dir.name,
+            'files': files,
+        }
+        manifest_path = self.manifests_dir / f'{snapshot_id}.json'
+        tmp_path = manifest_path.with_name(f'.{manifest_path.name}.tmp')
+        tmp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True) + '\n')
+        os.replace(tmp_path, manifest_path)
+
+        return snapshot_id, stats
+
+    def restore(self, snapshot_id, dest_root):
+        """Rebuild a snapshot under dest_root, replacing the snapshotted directory
+
+        Returns the number of files restored, or None if the snapshot is unknown
+        or a blob is missing.
+        """
+        manifest = self.load_manifest(snapshot_id)
+        if manifest is None:
+            return None
+
+        files = manifest['files']
+        missing = [p for p, meta in files.items() if not self._object_path(meta['sha256']).exists()]
+        if missing:
+            raise FileNotFoundError(f"{len(missing)} blob(s) missing from store, e.g. {missing[0]}")
+
+        dest_root = Path(dest_root)
+        target_dir = dest_root / manifest['source']
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+
+        for rel_path, meta in files.items():
+            dest = dest_root / rel_path
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._object_path(meta['sha256']), dest)
+            os.utime(dest, ns=(meta['mtime'], meta['mtime']))
+
+        return len(files)
+
+    def gc(self):
+        """Delete blobs no manifest references; returns (blobs removed, bytes freed)"""
+        referenced = set()
+        for snapshot_id in self.list_snapshots():
+            manifest = self.load_manifest(snapshot_id)
+            referenced.update(meta['sha256'] for meta in manifest['files'].values())
+
+        removed = freed = 0
+        for blob_path in self.objects_dir.glob('*/*'):
+            if blob_path.name.startswith('.'):
+                continue
+            if blob_path.parent.name + blob_path.name not in referenced:
+                freed += blob_path.stat().st_size
+                blob_path.unlink()
+                removed += 1
+        return removed, freed
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Streaming ZIP Extraction
+Parses ZIP local file headers as bytes arrive (e.g. from an HTTP download)
+and writes selected members straight to disk, without a seekable archive
+"""
+
+import zlib
+import struct
+from pathlib import PurePosixPath
+
+LOCAL_HEADER = 0x04034B50
+CENTRAL_HEADER = 0x02014B50
+END_OF_CENTRAL_DIR = 0x06054B50
+DATA_DESCRIPTOR = 0x08074B50
+
+STORED = 0
+DEFLATED = 8
+
+
+class StreamError(Exception):
+    pass
+
+
+class ChunkReader:
+    """Read exact byte counts from an iterator of chunks, optionally teeing every byte"""
+
+    def __init__(self, chunks, tee=None):
+        self.chunks = iter(chunks)
+        self.tee = tee
+        self.buffer = bytearray()
+        self.bytes_read = 0
+
+    def _fill(self):
+        for chunk in self.chunks:
+            if chunk:
+                if self.tee:
+                    self.tee.write(chunk)
+                self.buffer += chunk
+                return True
+        return False
+
+    def read(self, size):
+        while len(self.buffer) < size:
+            if not self._fill():
+                raise StreamError(f"Archive truncated (wanted {size} bytes, have {len(self.buffer)})")
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        self.bytes_read += size
+        return data
+
+    def read_some(self, max_size):
+        """Return up to max_size buffered bytes (fetching one chunk if empty), b'' at EOF"""
+        if not self.buffer and not self._fill():
+            return b''
+        data = bytes(self.buffer[:max_size])
+        del self.buffer[:max_size]
+        self.bytes_read += len(data)
+        return data
+
+    def unread(self, data):
+        self.buffer[:0] = data
+        self.bytes_read -= len(data)
+
+    def drain(self):
+        """Consume the rest of the stream so a tee receives the whole archive"""
+        while self._fill():
+            self.bytes_read += len(self.buffer)
+            self.buffer.clear()
+
+
+def _zip64_sizes(extra, csize, usize):
+    """Replace 0xFFFFFFFF sizes with values from a ZIP64 extra field"""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, length = struct.unpack_from('<HH', extra, offset)
+        if header_id == 0x0001:
+            values = extra[offset + 4:offset + 4 + length]
+            pos = 0
+            if usize == 0xFFFFFFFF and pos + 8 <= len(values):
+                usize = struct.unpack_from('<Q', values, pos)[0]
+                pos += 8
+            if csize == 0xFFFFFFFF and pos + 8 <= len(values):
+                csize = struct.unpack_from('<Q', values, pos)[0]
+            return csize, usize, True
+        offset += 4 + length
+    return csize, usize, False
+
+
+def iter_members(reader, chunk_size=65536):
+    """Yield (name, data_iter) for each member in stream order
+
+    data_iter yields decompressed chunks and checks the CRC once exhausted.
+    The consumer must exhaust data_iter before advancing to the next member.
+    """
+    while True:
+        signature = struct.unpack('<I', reader.read(4))[0]
+        if signature in (CENTRAL_HEADER, END_OF_CENTRAL_DIR):
+            return
+        if signature != LOCAL_HEADER:
+            raise StreamError(f"Unexpected signature 0x{signature:08x} at byte {reader.bytes_read - 4}")
+
+        (_, flags, method, _, _, crc, csize, usize,
+         name_len, extra_len) = struct.unpack('<HHHHHIIIHH', reader.read(26))
+        raw_name = reader.read(name_len)
+        name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437')
+        extra = reader.read(extra_len)
+        csize, usize, is_zip64 = _zip64_sizes(extra, csize, usize)
+        has_descriptor = bool(flags & 0x08)
+
+        if flags & 0x01:
+            raise StreamError(f"Encrypted member not supported: {name}")
+        if method not in (STORED, DEFLATED):
+            raise StreamError(f"Unsupported compression method {method}: {name}")
+        if has_descriptor and method == STORED:
+            raise StreamError(f"Stored member with data descriptor cannot be streamed: {name}")
+
+        def data_iter(method=method, csize=csize, crc=crc, name=name,
+                      has_descriptor=has_descriptor, is_zip64=is_zip64):
+            actual_crc = 0
+            if method == STORED:
+                remaining = csize
+                while remaining:
+                    chunk = reader.read(min(chunk_size, remaining))
+                    remaining -= len(chunk)
+                    actual_crc = zlib.crc32(chunk, actual_crc)
+                    yield chunk
+            else:
+                decompressor = zlib.decompressobj(-15)
+                remaining = None if has_descriptor else csize
+                while not decompressor.eof:
+                    want = chunk_size if remaining is None else min(chunk_size, remaining)
+                    if want == 0:
+                        raise StreamError(f"Deflate stream for {name} ended early")
+                    compressed = reader.read_some(want)
+                    if not compressed:
+                        raise StreamError(f"Archive truncated inside {name}")
+                    if remaining is not None:
+                        remaining -= len(compressed)
+                    chunk = decompressor.decompress(compressed)
+                    if chunk:
+                        actual_crc = zlib.crc32(chunk, actual_crc)
+                        yield chunk
+                if decompressor.unused_data:
+                    reader.unread(decompressor.unused_data)
+
+            if has_descriptor:
+                first = struct.unpack('<I', reader.read(4))[0]
+                if first == DATA_DESCRIPTOR:
+                    first = struct.unpack('<I', reader.read(4))[0]
+                crc = first
+                reader.read(16 if is_zip64 else 8)
+
+            if actual_crc & 0xFFFFFFFF != crc:
+                raise StreamError(f"Bad CRC-32 for {name}")
+
+        yield name, data_iter()
+
+
+def safe_relative_path(name):
+    """Return a safe relative POSIX path for an archive member, or None"""
+    path = PurePosixPath(name)
+    if path.is_absolute() or '..' in path.parts or not path.parts:
+        return None
+    return path
+
+
+# Hugo site directories: a first member under one of these means a root-level export
+SITE_DIRS = {'archetypes', 'assets', 'content', 'data', 'i18n', 'layouts', 'static', 'themes'}
+
+
+def _theme_prefix(path, is_dir, top_dirs):
+    """Archive prefix parts the theme lives under, judged from the first member
+
+    A stream can't be scanned ahead like find_theme_prefix does, but an export
+    is either the site at the root or the site inside one top-level directory.
+    """
+    if (len(path.parts) == 1 and not is_dir) or path.parts[0] in top_dirs or path.parts[0] in SITE_DIRS:
+        return ()
+    return path.parts[:1]
+
+
+def stream_extract(chunks, dest_dir, top_dirs, tee=None):
+    """Extract members under top_dirs (e.g. content/, static/) into dest_dir
+
+    The theme may sit at the archive root or inside one top-level directory,
+    fixed by the first member; either way members land at
+    dest_dir/<top_dir>/... Members outside the theme or top_dirs are read and
+    discarded. Returns a stats dict.
+    """
+    reader = ChunkReader(chunks, tee=tee)
+    stats = {'members': 0, 'written': 0, 'bytes': 0}
+    prefix = None
+
+    for name, data in iter_members(reader):
+        stats['members'] += 1
+        path = safe_relative_path(name)
+        target = None
+
+        if path and '__MACOSX' not in path.parts and not path.name.startswith('._'):
+            if prefix is None:
+                prefix = _theme_prefix(path, name.endswith('/'), top_dirs)
+            parts = path.parts
+            if (not name.endswith('/') and len(parts) > len(prefix) + 1
+                    and parts[:len(prefix)] == prefix and parts[len(prefix)] in top_dirs):
+                target = PurePosixPath(*parts[len(prefix):])
+
+        if target is None:
+            for _ in data:
+                pass
+            continue
+
+        dest = dest_dir / target
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, 'wb') as f:
+            for chunk in data:
+                f.write(chunk)
+                stats['bytes'] += len(chunk)
+        stats['written'] += 1
+
+    # Keep reading through the central directory so a tee gets a complete archive
+    reader.drain()
+    return stats
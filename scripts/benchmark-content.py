@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark the content tools on a synthetic corpus of scraped meeting posts.
+
+  generate  Write realistic meeting posts (with the scraper's duplicated text,
+            bylines and standalone list markers) at a configurable scale
+  run       Time each stage of clean-meetings.py and validate-meetings.py over
+            a corpus and append files/sec and peak memory to a results file
+"""
+
+import sys
+import json
+import time
+import random
+import platform
+import tracemalloc
+from pathlib import Path
+from datetime import date, datetime, timedelta
+
+from script_loader import load_script
+
+clean_meetings = load_script('clean-meetings.py', 'clean_meetings')
+validate_meetings = load_script('validate-meetings.py', 'validate_meetings')
+
+MEETING_TYPES = ('Open Meeting', 'Executive Meeting', 'Tribal Open Meeting')
+AUTHORS = ('Michelle Hatcher', 'Doug Hatcher')
+TOPICS = ('the budget for the upcoming pauwau', 'repairs to the tribal grounds',
+          'the roll book update', 'grant applications', 'the youth program',
+          'scholarship awards', 'the cultural center', 'membership card renewals')
+
+
+def generate_post(rng, index, meeting_date, duplication, items):
+    """One scraped meeting post, as Micro.blog exported it"""
+    meeting_type = rng.choice(MEETING_TYPES)
+    title = f"{meeting_date:%B} {meeting_type} Summary"
+    published = meeting_date + timedelta(days=rng.randint(1, 20))
+
+    lines = [f"# {title}", '', '-', '', rng.choice(AUTHORS),
+             f"- {published:%b} {published.day}", f"- {rng.randint(3, 40)} min read", '',
+             f"Tribal {meeting_type} Summary {meeting_date.month}/{meeting_date.day}/{meeting_date.year}", '']
+    for item in range(1, items + 1):
+        topic = rng.choice(TOPICS)
+        lines += [f"{item}.", '', f"The council discussed {topic} and voted to move forward.",
+                  '  a.', f"Motion made to table {rng.choice(TOPICS)} until next month.", '-', '']
+        lines.append(' '.join(f"Members asked about {rng.choice(TOPICS)}." for _ in range(rng.randint(2, 6))))
+        lines.append('')
+    block = lines[10:]
+
+    # The scraper repeated the whole summary several times over
+    body = lines + block * (duplication - 1) + ['', 'Tags:', '', 'meetings', '']
+    front_matter = [
+        '---',
+        f'title: "{title}"',
+        f"date: {published:%Y-%m-%d}T10:00:00-05:00",
+        f"guid: http://waccamaw.micro.blog/{published:%Y/%m/%d}/{index}.html",
+        f"post_id: {4000000 + index}",
+        'microblog: false',
+        '---',
+    ]
+    return published, '\n'.join(front_matter + [''] + body)
+
+
+def generate_corpus(output_dir, count, duplication, items, seed):
+    """Write count posts under output_dir/content/YYYY/MM/DD/; returns total bytes"""
+    rng = random.Random(seed)
+    start = date(2015, 1, 1)
+    total = 0
+    for index in range(count):
+        meeting_date = start + timedelta(days=index * 30 + rng.randint(0, 6))
+        published, text = generate_post(rng, index, meeting_date, duplication, items)
+        path = (Path(output_dir) / 'content' / f"{published:%Y/%m/%d}"
+                / f"{meeting_date:%B}-meeting-summary-{index}.md".lower())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        total += len(text.encode('utf-8'))
+    return total
+
+
+def _measure(func, inputs, repeat):
+    """Best wall time over repeat passes, then peak traced memory from one more pass"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            func(value)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # tracemalloc slows everything down, so it gets its own pass
+    tracemalloc.start()
+    for value in inputs:
+        func(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(corpus_dir, repeat=3):
+    files = sorted(str(path) for path in Path(corpus_dir).rglob('*.md'))
+    if not files:
+        return None
+
+    bodies = []
+    for filepath in files:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            parts = f.read().split('---', 2)
+        bodies.append(parts[2] if len(parts) == 3 else '')
+    deduped = [clean_meetings.remove_duplicates(body) for body in bodies]
+    total_bytes = sum(len(body.encode('utf-8')) for body in bodies)
+
+    # Each stage sees what it would see in a real run
+    stages = (
+        ('extract_meeting_date', clean_meetings.extract_meeting_date, bodies),
+        ('remove_duplicates', clean_meetings.remove_duplicates, bodies),
+        ('clean_content_body', clean_meetings.clean_content_body, deduped),
+        # Whole scraped bodies, duplication included: where streaming the line stages pays off
+        ('clean_content_body_raw', clean_meetings.clean_content_body, bodies),
+        ('validate_front_matter', validate_meetings.validate_front_matter, files),
+    )
+
+    result = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'files': len(files),
+        'bytes': total_bytes,
+        'stages': {},
+    }
+    for name, func, inputs in stages:
+        seconds, peak = _measure(func, inputs, repeat)
+        result['stages'][name] = {
+            'seconds': round(seconds, 4),
+            'files_per_sec': round(len(inputs) / seconds, 1) if seconds else None,
+            'peak_kb': round(peak / 1024),
+        }
+    return result
+
+
+def load_results(results_path):
+    if not results_path.exists():
+        return []
+    with open(results_path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def report(result, previous=None, max_regression=None):
+    """Print a stage table (with change vs the previous comparable run); returns regressed stages"""
+    print(f"📊 {result['files']} files, {result['bytes'] / 1024 / 1024:.2f}MB of post bodies\n")
+    print(f"   {'stage':<24}{'files/sec':>12}{'peak mem':>12}{'vs previous':>14}")
+    regressed = []
+    for name, stage in result['stages'].items():
+        change = ''
+        before = previous and previous['stages'].get(name)
+        if before and before.get('files_per_sec') and stage['files_per_sec']:
+            delta = (stage['files_per_sec'] / before['files_per_sec'] - 1) * 100
+            change = f"{delta:+.1f}%"
+            if max_regression is not None and delta < -max_regression:
+                regressed.append(name)
+                change += ' ❌'
+        print(f"   {name:<24}{stage['files_per_sec'] or 0:>12.1f}{stage['peak_kb']:>10}KB{change:>14}")
+    return regressed
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the meeting content tools on a synthetic corpus')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help='Write a synthetic corpus of scraped meeting posts')
+    generate.add_argument('output_dir', help='Directory to write content/YYYY/MM/DD/*.md into')
+    generate.add_argument('--count', type=int, default=200, help='Number of posts (default: 200)')
+    generate.add_argument('--duplication', type=int, default=4,
+                          help='Times the scraper repeated each summary (default: 4)')
+    generate.add_argument('--items', type=int, default=12, help='Agenda items per meeting (default: 12)')
+    generate.add_argument('--seed', type=int, default=1, help='Random seed, for repeatable corpora (default: 1)')
+
+    run = subparsers.add_parser('run', help='Time each stage over a corpus and record the results')
+    run.add_argument('corpus_dir', help='Directory searched recursively for *.md posts')
+    run.add_argument('--repeat', type=int, default=3, help='Timed passes per stage; the best is kept (default: 3)')
+    run.add_argument('--results', default='.cache/benchmarks/content-tools.jsonl',
+                     help='JSON-lines results history (default: .cache/benchmarks/content-tools.jsonl)')
+    run.add_argument('--max-regression', type=float, default=None, metavar='PCT',
+                     help='Exit 1 if any stage is more than PCT%% slower than the previous run on the same corpus')
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        total = generate_corpus(args.output_dir, args.count, args.duplication, args.items, args.seed)
+        print(f"✅ Wrote {args.count} posts ({total / 1024 / 1024:.2f}MB) to {args.output_dir}/content")
+        return
+
+    result = run_benchmarks(args.corpus_dir, repeat=args.repeat)
+    if result is None:
+        print(f"❌ Error: no markdown files under {args.corpus_dir}")
+        sys.exit(1)
+
+    # Only compare against a run over the same corpus
+    results_path = Path(args.results)
+    previous = [entry for entry in load_results(results_path)
+                if entry['files'] == result['files'] and entry['bytes'] == result['bytes']]
+    regressed = report(result, previous[-1] if previous else None, args.max_regression)
+
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(results_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(result) + '\n')
+    print(f"\n📝 Results appended to {results_path}")
+
+    if regressed:
+        print(f"❌ Regression over {args.max_regression}% in: {', '.join(regressed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
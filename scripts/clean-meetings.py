@@ -12,12 +12,25 @@ Fixes:
 7. Preserves Micro.blog required fields (guid, post_id, photos, microblog)
 """
 
+import io
 import os
 import re
 import sys
+import json
+import zlib
+import hashlib
+import argparse
+from collections import deque, defaultdict
+from itertools import accumulate, chain, compress, count, islice, repeat
+from operator import eq, getitem, gt, ne, sub
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+import content_scan
+from content_scan import read_parts, file_sha256
+
 def extract_meeting_date(content):
     """Extract actual meeting date from content like 'held at the tribal office 8/1/2025'"""
     
@@ -36,37 +49,161 @@ def extract_meeting_date(content):
     
     return None
 
-def remove_duplicates(content):
-    """Remove massive text duplication by finding repeated sections"""
-    
-    # Split into lines
+def find_duplicate_lines(lines, window=5, min_chars=50):
+    """Mark lines that belong to a repeated block of at least `window` lines.
+    
+    Each line is numbered by its first occurrence, and each `window`-line
+    sequence is looked up as the tuple of those numbers, so candidates are
+    compared exactly and hash collisions can't drop text. Only the start of
+    each first occurrence is kept. When a sequence repeats, all of its lines
+    are marked, so overlapping windows cover repeated blocks of any length
+    >= window. Sequences with fewer than min_chars non-whitespace characters
+    are looked up by their start instead, which never repeats, so blank
+    lines and short list markers aren't treated as duplication.
+    
+    Every stage runs inside map/zip rather than a per-line Python loop, which
+    keeps this at or under the cost of joining each window into a string.
+    """
+    # chars[j] - chars[i] is the non-whitespace length of lines[i:j]
+    chars = list(accumulate(map(len, map(str.strip, lines)), initial=0))
+    long_enough = map(gt, map(sub, islice(chars, window, None), chars), repeat(min_chars))
+    line_ids = list(map({}.setdefault, lines, count()))
+    starts = range(len(lines) - window + 1)
+    blocks = zip(*(islice(line_ids, offset, None) for offset in range(window)))
+    keys = map(getitem, zip(starts, blocks), long_enough)
+    first_seen = {}
+    # One byte per start, little-endian, so shifting by 8 * offset moves each
+    # repeat's mark onto the following lines of its block
+    repeats = int.from_bytes(bytes(map(ne, map(first_seen.setdefault, keys, starts), starts)), 'little')
+    spread = repeats
+    for offset in range(1, window):
+        spread |= repeats << (8 * offset)
+    
+    return bytearray(spread.to_bytes(len(lines) + window, 'little')[:len(lines)])
+
+# bytes.translate table turning the removal marks into keep flags
+_KEEP = bytes([1, 0]) + bytes(254)
+
+def dedupe_content(content, window=5, min_chars=50):
+    """Remove repeated blocks; returns (content, stats) with lines/blocks/chars removed"""
     lines = content.split('\n')
+    removed = find_duplicate_lines(lines, window, min_chars)
     
-    # Find where duplication starts (usually after first few sections)
-    # Look for identical numbered list items appearing multiple times
-    seen_sequences = {}
-    clean_lines = []
-    
-    for i, line in enumerate(lines):
-        # Create a signature of this line and next few lines
-        if i < len(lines) - 5:
-            signature = '\n'.join(lines[i:i+5])
-            
-            # If we've seen this exact 5-line sequence before, it's likely duplication
-            if signature in seen_sequences and len(signature.strip()) > 50:
-                # Skip duplicated content
-                continue
-            
-            seen_sequences[signature] = True
-        
-        clean_lines.append(line)
-    
-    return '\n'.join(clean_lines)
+    dropped = list(compress(lines, removed))
+    stats = {
+        'lines': len(dropped),
+        'blocks': removed.count(b'\x00\x01') + removed.startswith(b'\x01'),
+        'chars': sum(map(len, dropped)) + len(dropped),
+    }
+    return '\n'.join(compress(lines, removed.translate(_KEEP))), stats
 
-def clean_front_matter(front_matter, actual_date, filename):
-    """Clean and update front matter with proper fields"""
-    
-    # Parse existing front matter
+def remove_duplicates(content):
+    """Remove massive text duplication by finding repeated sections"""
+    return dedupe_content(content)[0]
+
+# One-permutation MinHash over word 5-gram shingles: each shingle hash lands
+# in one of 128 bins and each bin keeps its minimum. With 16 LSH bands of 8
+# bins, posts that are 80% similar share a bucket ~95% of the time, while
+# posts that only share meeting boilerplate (~50%) rarely do; candidates are
+# then checked against the similarity threshold.
+_SHINGLE_WORDS = 5
+_MINHASH_BINS = 128
+_LSH_BANDS = 16
+_HASH_BITS = (1 << 64) - 1
+_HASH_MIX = 0x9E3779B97F4A7C15  # spreads CRC-32 values over 64 bits
+_WORD = re.compile(r'\w+')
+
+def minhash_signature(text):
+    """MinHash signature of a post's word shingles, or None if it has no words"""
+    words = _WORD.findall(text.lower())
+    if not words:
+        return None
+    if len(words) >= _SHINGLE_WORDS:
+        shingles = zip(*(words[i:] for i in range(_SHINGLE_WORDS)))
+    else:
+        shingles = [tuple(words)]
+    
+    # CRC-32 is deterministic across runs, unlike hash() on strings
+    bins = [None] * _MINHASH_BINS
+    for crc in set(map(zlib.crc32, map(str.encode, map(' '.join, shingles)))):
+        value, slot = divmod(crc * _HASH_MIX & _HASH_BITS, _MINHASH_BINS)
+        if bins[slot] is None or value < bins[slot]:
+            bins[slot] = value
+    
+    # Empty bins (short posts) borrow the next filled bin's minimum, tagged with
+    # the distance, so two posts only agree there if they agree on the source
+    filled = list(bins)
+    for slot in range(_MINHASH_BINS):
+        distance = 1
+        while bins[slot] is None:
+            source = filled[(slot + distance) % _MINHASH_BINS]
+            if source is not None:
+                bins[slot] = source + (distance << 64)
+            distance += 1
+    return tuple(bins)
+
+def signature_similarity(a, b):
+    """Estimated Jaccard similarity: the fraction of matching signature slots"""
+    return sum(map(eq, a, b)) / len(a)
+
+def find_near_duplicates(documents, threshold=0.8):
+    """Cluster near-duplicate posts across the corpus with MinHash + LSH.
+    
+    documents maps a key (path) to its text. Posts only become candidates
+    when they share an LSH bucket, so this is roughly linear in the number
+    of posts rather than pairwise. Candidates at or above threshold are
+    merged into clusters. Each cluster's canonical post is the longest (most
+    complete) one. Returns [{'canonical': key, 'duplicates': [(key, similarity)]}].
+    """
+    signatures = {}
+    for key, text in documents.items():
+        signature = minhash_signature(text)
+        if signature:
+            signatures[key] = signature
+    
+    rows = _MINHASH_BINS // _LSH_BANDS
+    buckets = defaultdict(list)
+    for key, signature in signatures.items():
+        for band in range(_LSH_BANDS):
+            buckets[band, signature[band * rows:(band + 1) * rows]].append(key)
+    
+    parent = {key: key for key in signatures}
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+    
+    checked = set()
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                if (a, b) in checked:
+                    continue
+                checked.add((a, b))
+                if find(a) != find(b) and signature_similarity(signatures[a], signatures[b]) >= threshold:
+                    parent[find(a)] = find(b)
+    
+    groups = defaultdict(list)
+    for key in signatures:
+        groups[find(key)].append(key)
+    
+    clusters = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        members.sort(key=lambda key: (-len(documents[key]), key))
+        canonical = members[0]
+        clusters.append({
+            'canonical': canonical,
+            'duplicates': [(key, signature_similarity(signatures[canonical], signatures[key]))
+                           for key in members[1:]],
+        })
+    clusters.sort(key=lambda cluster: cluster['canonical'])
+    return clusters
+
+def parse_front_matter(front_matter):
+    """Parse flat 'key: value' front matter lines into a dict of raw strings"""
     lines = front_matter.strip().split('\n')
     fields = {}
     
@@ -76,6 +213,14 @@ def clean_front_matter(front_matter, actual_date, filename):
             value = line.split(':', 1)[1].strip() if ':' in line else ''
             fields[key] = value
     
+    return fields
+
+def clean_front_matter(front_matter, actual_date, filename):
+    """Clean and update front matter with proper fields"""
+    
+    # Parse existing front matter
+    fields = parse_front_matter(front_matter)
+    
     # Extract meeting month/type from title or generate from filename
     title = fields.get('title', '').strip('"')
     
@@ -117,39 +262,144 @@ def clean_front_matter(front_matter, actual_date, filename):
     
     return '\n'.join(clean_fm)
 
-def clean_content_body(body):
-    """Remove scraper artifacts and clean up content"""
-    
-    # Strip leading whitespace FIRST
-    body = body.lstrip()
-    
-    # Remove ALL markdown headers at the start (# Title lines)
-    # This handles the duplicate title that appears in the body
-    while body.startswith('#'):
-        # Find the end of this header line
-        first_newline = body.find('\n')
-        if first_newline != -1:
-            body = body[first_newline+1:].lstrip()
-        else:
+# Patterns used by clean_content_body, compiled once
+_ARTIFACT_NAME = re.compile(r'\s*(?:Michelle|Doug)\s+Hatcher\s*')
+_ARTIFACT_READ_TIME = re.compile(r'-\s*\d+\s*min\s*read\s*')
+_LIST_MARKER = re.compile(r'^(\s*)([0-9]+|[a-z]|[A-Z]|[ivxIVX]+)\.\s*$')
+_HIGH_NUMBER_INDENT = re.compile(r'^ {4,}([1-9]\d+\.)')
+
+# The cleanup stages below are generators over lines. A stage only buffers
+# lines (in `pending`) while it is looking ahead to decide what to do.
+
+def _peek(lines, pending, n):
+    """Return the line n positions ahead (buffering it in pending), or None past the end"""
+    while len(pending) <= n:
+        line = next(lines, None)
+        if line is None:
+            return None
+        pending.append(line)
+    return pending[n]
+
+def _next_nonblank(lines, pending, n=0):
+    """Return the position of the first non-blank line at or after n, or None"""
+    while True:
+        line = _peek(lines, pending, n)
+        if line is None:
+            return None
+        if line.strip():
+            return n
+        n += 1
+
+def _strip_leading_headers(lines):
+    """Drop leading whitespace and every '# Title' line at the start of the body"""
+    lines = iter(lines)
+    line = ''
+    while True:
+        while not line.strip():
+            line = next(lines, None)
+            if line is None:
+                return iter(())
+        line = line.lstrip()
+        if not line.startswith('#'):
             break
-    
-    # Remove scraper artifacts: "-\n\nMichelle Hatcher\n- Sep 23\n- 31 min read"
-    body = re.sub(r'-\s*\n\s*(?:Michelle|Doug)\s+Hatcher\s*\n-[^\n]+\n-\s*\d+\s*min\s*read\s*\n', '', body)
-    
-    # Remove standalone hyphens (empty list items)
-    body = re.sub(r'^\s*-\s*$', '', body, flags=re.MULTILINE)
-    
-    # Fix list formatting: merge standalone list markers with their content
-    # Use 3-space indentation per level (markdown standard for nested ordered lists)
-    # Auto-detect nesting level based on number value
-    lines = body.split('\n')
-    cleaned_lines = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        # Check if this is a standalone list marker
-        list_match = re.match(r'^(\s*)([0-9]+|[a-z]|[A-Z]|[ivxIVX]+)\.\s*$', line)
-        if list_match and i + 1 < len(lines):
+        # A header is only dropped if a newline follows it
+        following = next(lines, None)
+        if following is None:
+            break
+        line = following
+    return chain((line,), lines)
+
+def _match_artifact(lines, pending):
+    """Match a '\\n\\nMichelle Hatcher\\n- Sep 23\\n- 31 min read\\n' byline ahead
+    
+    Returns the position of the line that follows it (blank lines after the
+    byline go with it), or None.
+    """
+    name = _next_nonblank(lines, pending)
+    if name is None or not _ARTIFACT_NAME.fullmatch(pending[name]):
+        return None
+    date = _next_nonblank(lines, pending, name + 1)
+    if date is None or len(pending[date]) < 2 or pending[date][0] != '-':
+        return None
+    read_time = _peek(lines, pending, date + 1)
+    if read_time is None or not _ARTIFACT_READ_TIME.fullmatch(read_time):
+        return None
+    # The byline must end in a newline
+    if _peek(lines, pending, date + 2) is None:
+        return None
+    after = _next_nonblank(lines, pending, date + 2)
+    if after is None:
+        after = len(pending) - 1
+    return after
+
+def _remove_artifacts(lines):
+    """Remove reading-time bylines, which hang off a trailing '-' on the line before"""
+    lines = iter(lines)
+    pending = deque()
+    while True:
+        line = pending.popleft() if pending else next(lines, None)
+        if line is None:
+            return
+        stripped = line.rstrip()
+        while stripped.endswith('-'):
+            after = _match_artifact(lines, pending)
+            if after is None:
+                break
+            # The line after the byline is joined onto the text before the '-'
+            for _ in range(after):
+                pending.popleft()
+            line = stripped[:-1] + pending.popleft()
+            stripped = line.rstrip()
+        yield line
+
+def _remove_standalone_hyphens(lines):
+    """Replace a lone '-' line, with the blank lines around it, by one empty line"""
+    lines = iter(lines)
+    pending = deque()
+    blanks = []
+    while True:
+        line = pending.popleft() if pending else next(lines, None)
+        if line is None:
+            yield from blanks
+            return
+        stripped = line.strip()
+        if not stripped:
+            blanks.append(line)
+            continue
+        if stripped != '-':
+            if blanks:
+                yield from blanks
+                blanks.clear()
+            yield line
+            continue
+        
+        # An exactly empty line before the next '-' lets the regex this replaces
+        # carry on into it, so back-to-back matches become one empty line
+        following = _next_nonblank(lines, pending)
+        while (following and pending[following - 1] == ''
+               and pending[following].strip() == '-'):
+            following = _next_nonblank(lines, pending, following + 1)
+        blanks.clear()
+        yield ''
+        if following is None:
+            return
+        for _ in range(following):
+            pending.popleft()
+
+def _merge_list_markers(lines):
+    """Merge standalone list markers ('3.', 'b.') with the content that follows
+    
+    Use 3-space indentation per level (markdown standard for nested ordered lists)
+    and auto-detect nesting level based on number value.
+    """
+    lines = iter(lines)
+    pending = deque()
+    while True:
+        line = pending.popleft() if pending else next(lines, None)
+        if line is None:
+            return
+        list_match = _LIST_MARKER.match(line)
+        if list_match and _peek(lines, pending, 0) is not None:
             indent_spaces = len(list_match.group(1))
             marker = list_match.group(2)
             
@@ -167,36 +417,62 @@ def clean_content_body(body):
             markdown_indent = '   ' * nest_level  # Markdown uses 3-space increments
             
             # Look ahead for content (skip max 2 blank lines)
-            j = i + 1
-            blanks_skipped = 0
-            while j < len(lines) and not lines[j].strip() and blanks_skipped < 2:
-                blanks_skipped += 1
+            j = 0
+            content = pending[0]
+            while j < 2 and content is not None and not content.strip():
                 j += 1
-            if j < len(lines) and lines[j].strip():
+                content = _peek(lines, pending, j)
+            if content is not None and content.strip():
                 # Merge: add proper markdown indentation, marker, and content on same line
-                content = lines[j].strip()
-                cleaned_lines.append(f"{markdown_indent}{marker}. {content}")
-                i = j + 1
+                for _ in range(j + 1):
+                    pending.popleft()
+                line = f"{markdown_indent}{marker}. {content.strip()}"
+        
+        # ONLY remove leading spaces from high-numbered items (10+) that should be top-level
+        # Don't touch properly indented sub-items (1-9 with indentation are legitimate nesting)
+        if line.startswith('    '):
+            high_match = _HIGH_NUMBER_INDENT.match(line)
+            if high_match:
+                line = high_match.group(1) + line[high_match.end():]
+        yield line
+
+def _drop_tags_and_blank_runs(lines):
+    """Collapse runs of empty lines and stop at a 'Tags:' section
+    
+    The Tags line is held back one line: a 'Tags:' with no newline after it
+    isn't a section heading and is kept.
+    """
+    previous_empty = False
+    tags = None
+    for index, line in enumerate(lines):
+        if tags is not None:
+            return
+        if not line:
+            if previous_empty:
                 continue
-        cleaned_lines.append(line)
-        i += 1
-    
-    body = '\n'.join(cleaned_lines)
-    
-    # ONLY remove leading spaces from high-numbered items (10+) that should be top-level
-    # Don't touch properly indented sub-items (1-9 with indentation are legitimate nesting)
-    body = re.sub(r'^ {4,}([1-9]\d+\.)', r'\1', body, flags=re.MULTILINE)  # Only numbers >= 10
-    
-    # Clean up excessive blank lines
-    body = re.sub(r'\n{3,}', '\n\n', body)
-    
-    # Remove "Tags:" section at end (we're using proper categories now)
-    body = re.sub(r'\n+Tags:\s*\n[\s\S]*$', '', body)
-    
-    # Clean up excessive whitespace but preserve paragraph breaks
-    body = re.sub(r'\n{3,}', '\n\n', body)
-    
-    return body.strip()
+            previous_empty = True
+        else:
+            previous_empty = False
+            if index and line.startswith('Tags:') and not line[5:].strip():
+                tags = line
+                continue
+        yield line
+    if tags is not None:
+        yield tags
+
+def clean_content_body(body):
+    """Remove scraper artifacts and clean up content
+    
+    The body is split into lines once and streamed through the cleanup
+    stages, then joined once; no stage copies the whole body.
+    """
+    lines = _strip_leading_headers(body.split('\n'))
+    if 'Hatcher' in body:
+        lines = _remove_artifacts(lines)
+    lines = _remove_standalone_hyphens(lines)
+    lines = _merge_list_markers(lines)
+    lines = _drop_tags_and_blank_runs(lines)
+    return '\n'.join(lines).strip()
 
 def process_meeting_file(filepath):
     """Process a single meeting file"""
@@ -204,17 +480,13 @@ def process_meeting_file(filepath):
     print(f"\n{'='*60}")
     print(f"Processing: {filepath}")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Split front matter and body
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    # Split front matter and body (mapped, so only the body is held as text)
+    parts = read_parts(filepath)
+    if parts is None:
         print("  ❌ Invalid format (no front matter)")
         return None
     
-    front_matter = parts[1]
-    body = parts[2]
+    front_matter, body = parts
     
     # Extract actual meeting date from content
     actual_date = extract_meeting_date(body)
@@ -249,8 +521,9 @@ def process_meeting_file(filepath):
     
     # Remove duplicates from body
     print(f"  Original body size: {len(body)} chars")
-    body = remove_duplicates(body)
-    print(f"  After deduplication: {len(body)} chars")
+    body, dedupe_stats = dedupe_content(body)
+    print(f"  After deduplication: {len(body)} chars "
+          f"(removed {dedupe_stats['lines']} lines in {dedupe_stats['blocks']} repeated blocks)")
     
     # Clean content body
     body = clean_content_body(body)
@@ -266,36 +539,224 @@ def process_meeting_file(filepath):
         'date': actual_date
     }
 
+CONTENT_DIR = Path('/workspaces/waccamawdotorg/content')
+CACHE_DIR = CONTENT_DIR.parent / '.cache' / 'clean-meetings'
+DISCOVERY_INDEX = CACHE_DIR / 'discovery.json'
+
+RESULT_CACHE = CACHE_DIR / 'results.json'
+
+# Any edit to this script (or the scanner it reads posts with) invalidates cached results
+CLEANER_VERSION = hashlib.sha256(
+    Path(__file__).read_bytes() + Path(content_scan.__file__).read_bytes()
+).hexdigest()[:16]
+
+MEETING_TERMS = ('meeting summary', 'open meeting', 'executive meeting', 'tribal open meeting')
+
+def is_meeting_post(filepath):
+    """Check if it's a meeting post by reading the first 500 chars"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            preview = f.read(500).lower()
+    except (OSError, UnicodeDecodeError):
+        return False
+    return any(term in preview for term in MEETING_TERMS)
+
+def _scan_markdown(directory):
+    """Yield (path, stat) for markdown files, skipping meetings/ directories
+    
+    Directory entries carry their type, so each file costs one stat call.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != 'meetings':
+                    yield from _scan_markdown(entry.path)
+            elif entry.name.endswith('.md') and entry.is_file():
+                yield entry.path, entry.stat()
+
+def load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_json(data, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(data, indent=1, sort_keys=True) + '\n', encoding='utf-8')
+    os.replace(tmp_path, path)
+
+def discover_meeting_files(content_dir=CONTENT_DIR, index_path=DISCOVERY_INDEX, changed_paths=None):
+    """Find meeting posts, re-reading only files that are new or modified
+    
+    The index maps each markdown path to its size, mtime and classification,
+    so an unchanged file is never opened again. With changed_paths (e.g.
+    `git diff --name-only` output, relative to the repository root) only those
+    paths are checked and the rest of the index is trusted; without an index
+    a full scan is done instead. Returns (sorted meeting paths, stats).
+    """
+    index = load_json(index_path)
+    stats = {'files': 0, 'read': 0}
+    
+    def classify(path, st):
+        entry = index.get(path)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            return entry
+        stats['read'] += 1
+        return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'meeting': is_meeting_post(path)}
+    
+    if changed_paths is None or not index:
+        new_index = {path: classify(path, st) for path, st in _scan_markdown(content_dir)}
+    else:
+        new_index = dict(index)
+        repo_root = content_dir.parent
+        for name in changed_paths:
+            path = repo_root / name.strip()
+            try:
+                relative = path.relative_to(content_dir)
+            except ValueError:
+                continue
+            if path.suffix != '.md' or 'meetings' in relative.parts[:-1]:
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                new_index.pop(str(path), None)
+                continue
+            new_index[str(path)] = classify(str(path), st)
+    
+    stats['files'] = len(new_index)
+    if new_index != index:
+        save_json(new_index, index_path)
+    return sorted(path for path, entry in new_index.items() if entry['meeting']), stats
+
+def load_result_cache(cache_path=RESULT_CACHE):
+    """Map of input path -> {sha256, version, output} for files already cleaned"""
+    return load_json(cache_path)
+
+def record_result(cache, filepath, sha256, output):
+    """Remember that filepath, with this content hash, was cleaned into output"""
+    cache[filepath] = {'sha256': sha256, 'version': CLEANER_VERSION, 'output': output}
+
+def is_cached(cache, filepath, sha256):
+    entry = cache.get(filepath)
+    return bool(entry and entry['sha256'] == sha256 and entry['version'] == CLEANER_VERSION
+                and os.path.exists(entry['output']))
+
+def write_if_changed(path, content):
+    """Atomically write content unless the file already holds exactly these bytes
+    
+    Leaving identical files alone keeps their mtimes, so Micro.blog doesn't
+    re-import them. Returns True if the file was written.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+def _process_captured(filepath):
+    """Worker: process one file, capturing its log so output stays in file order"""
+    log = io.StringIO()
+    with redirect_stdout(log):
+        result = process_meeting_file(filepath)
+    return result, log.getvalue()
+
+def process_files(meeting_files, jobs=1):
+    """Process files serially or across a process pool; results keep input order"""
+    if jobs <= 1:
+        return [process_meeting_file(filepath) for filepath in meeting_files]
+    
+    results = []
+    chunksize = max(1, len(meeting_files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for result, log in pool.map(_process_captured, meeting_files, chunksize=chunksize):
+            print(log, end='')
+            results.append(result)
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Clean and reorganize meeting posts for Micro.blog compatibility')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be created without writing files')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Process files across N worker processes (0 = one per CPU, default: 1)')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Write cleaned files without the confirmation prompt (for batch runs)')
+    parser.add_argument('--changed-files', metavar='FILE',
+                        help="Only re-check these paths, e.g. `git diff --name-only` output ('-' reads stdin)")
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='Ignore the discovery index and re-read every markdown file')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Reprocess files even if their input and the cleaner are unchanged')
+    parser.add_argument('--skip-near-duplicates', action='store_true',
+                        help='Only write the canonical (longest) post of each near-duplicate cluster')
+    parser.add_argument('--similarity', type=float, default=0.8,
+                        help='Estimated Jaccard similarity for posts to count as near-duplicates (default: 0.8)')
+    args = parser.parse_args(argv)
+    if args.changed_files == '-' and not (args.yes or args.dry_run):
+        parser.error("--changed-files - reads stdin, so it needs --yes or --dry-run")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
 def main():
-    # Find all meeting posts
-    content_dir = Path('/workspaces/waccamawdotorg/content')
-    
-    # Search for meeting posts
-    meeting_files = []
-    for md_file in content_dir.rglob('*.md'):
-        # Skip if already in meetings directory
-        if '/meetings/' in str(md_file):
-            continue
-        
-        # Check if it's a meeting post by reading first 500 chars
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                preview = f.read(500).lower()
-                if any(term in preview for term in ['meeting summary', 'open meeting', 'executive meeting', 'tribal open meeting']):
-                    meeting_files.append(str(md_file))
-        except:
-            continue
+    args = parse_args()
+    
+    # Find all meeting posts (the discovery index skips files unchanged since last run)
+    changed_paths = None
+    if args.changed_files:
+        if args.changed_files == '-':
+            changed_paths = [line for line in sys.stdin.read().splitlines() if line.strip()]
+        else:
+            with open(args.changed_files, 'r', encoding='utf-8') as f:
+                changed_paths = [line for line in f.read().splitlines() if line.strip()]
+    if args.rebuild_index and DISCOVERY_INDEX.exists():
+        DISCOVERY_INDEX.unlink()
+    
+    meeting_files, discovery_stats = discover_meeting_files(changed_paths=changed_paths)
+    print(f"Indexed {discovery_stats['files']} markdown files (read {discovery_stats['read']} new or modified)")
+    
+    # Skip files whose input and cleaner are unchanged since they were last written
+    cache = {} if args.no_cache else load_result_cache()
+    input_hashes = {filepath: file_sha256(filepath) for filepath in meeting_files}
+    cached = {filepath for filepath in meeting_files if is_cached(cache, filepath, input_hashes[filepath])}
+    meeting_files = [filepath for filepath in meeting_files if filepath not in cached]
     
     print(f"\n{'='*60}")
-    print(f"Found {len(meeting_files)} meeting posts to clean")
+    print(f"Found {len(meeting_files)} meeting posts to clean"
+          f" ({len(cached)} unchanged since last run, skipped)")
     print(f"{'='*60}")
     
-    # Process each file
-    results = []
-    for filepath in meeting_files:
-        result = process_meeting_file(filepath)
-        if result:
-            results.append(result)
+    # Process each file (sorted so output and results are deterministic)
+    results = [result for result in process_files(meeting_files, jobs=args.jobs) if result]
+    
+    # The scraper saved some meetings under several paths and titles; find them across files,
+    # comparing against the already-written output of files skipped as unchanged
+    documents = {r['original']: r['content'].split('---', 2)[2] for r in results}
+    for filepath in cached:
+        with open(cache[filepath]['output'], 'r', encoding='utf-8') as f:
+            documents[filepath] = f.read().split('---', 2)[-1]
+    clusters = find_near_duplicates(documents, threshold=args.similarity)
+    if clusters:
+        print(f"\n{'='*60}")
+        print(f"Near-duplicate posts: {len(clusters)} clusters (similarity >= {args.similarity:.0%})")
+        for cluster in clusters:
+            print(f"  ★ {cluster['canonical']}")
+            for key, similarity in cluster['duplicates']:
+                print(f"    ≈ {key} ({similarity:.0%})")
+        if args.skip_near_duplicates:
+            duplicates = {key for cluster in clusters for key, _ in cluster['duplicates']}
+            results = [r for r in results if r['original'] not in duplicates]
+            print(f"  Keeping the canonical post (★) of each cluster; skipping {len(duplicates)} duplicates")
     
     print(f"\n{'='*60}")
     print(f"Summary: {len(results)} files processed successfully")
@@ -315,24 +776,34 @@ def main():
             print(f"  {year}: {count} meetings")
     
     # Ask for confirmation
-    if '--dry-run' in sys.argv:
+    if args.dry_run:
         print("\n🔍 DRY RUN - No files were modified")
         return
     
-    print("\nProceed with creating cleaned files? (y/N): ", end='')
-    response = input().strip().lower()
+    if args.yes:
+        response = 'y'
+    else:
+        print("\nProceed with creating cleaned files? (y/N): ", end='')
+        response = input().strip().lower()
     
     if response == 'y':
         # Create meetings directory
         os.makedirs('/workspaces/waccamawdotorg/content/meetings', exist_ok=True)
         
-        # Write cleaned files
+        # Write cleaned files (only when the bytes differ) and remember them
+        cache = load_result_cache()
+        written = 0
         for r in results:
-            with open(r['new_path'], 'w', encoding='utf-8') as f:
-                f.write(r['content'])
-            print(f"  ✓ Created {r['new_path']}")
+            if write_if_changed(r['new_path'], r['content']):
+                written += 1
+                print(f"  ✓ Created {r['new_path']}")
+            else:
+                print(f"  = Unchanged {r['new_path']}")
+            record_result(cache, r['original'], input_hashes[r['original']], r['new_path'])
+        save_json(cache, RESULT_CACHE)
         
-        print(f"\n✅ Successfully created {len(results)} cleaned meeting posts")
+        print(f"\n✅ Successfully created {written} cleaned meeting posts"
+              f" ({len(results) - written} already up to date)")
         print("\nNext steps:")
         print("1. Review the cleaned files in /content/meetings/")
         print("2. Delete the original duplicated files if satisfied")
@@ -0,0 +1,222 @@
+"""
+Bounded-memory scanning of content markdown files.
+
+Files are memory-mapped, so front matter boundaries, size and null bytes are
+found in the page cache without copying the file. Line lengths and the body's
+length are measured while decoding fixed-size chunks, which are hashed as
+they go, and only the front matter is ever held as a whole string. Shared by validate-meetings.py and
+clean-meetings.py.
+"""
+
+import io
+import os
+import re
+import mmap
+import codecs
+import hashlib
+from contextlib import contextmanager
+
+MAX_LINE_LENGTH = 10000
+# A line longer than MAX_LINE_LENGTH, found without splitting the text into lines
+LONG_LINE = re.compile(r'[^\n]{%d,}' % (MAX_LINE_LENGTH + 1))
+
+# Bytes decoded at a time; bounds the extra memory a scan needs
+SCAN_CHUNK = 1024 * 1024
+
+DELIMITER = '---'
+
+
+@contextmanager
+def mapped(filepath):
+    """Read-only mmap of a file (b'' for an empty file, which mmap refuses)"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def split_points(data):
+    """Offsets of the first two --- delimiters (-1 when missing), where str.split('---', 2) splits
+
+    Works on str, bytes or an mmap; '-' never occurs inside a multi-byte
+    UTF-8 sequence, so byte offsets split the text in the same places.
+    """
+    delimiter = DELIMITER if isinstance(data, str) else DELIMITER.encode()
+    first = data.find(delimiter)
+    second = data.find(delimiter, first + 3) if first != -1 else -1
+    return first, second
+
+
+def _newline_decoder():
+    # What open(..., 'r', encoding='utf-8') does: strict UTF-8 and universal newlines
+    return io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+
+
+def _decode(view):
+    """Decode a whole buffer without the bytes copy an incremental decoder makes"""
+    text = codecs.utf_8_decode(view, 'strict', True)[0]
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def read_parts(filepath):
+    """(front matter, body) of a post, as content.split('---', 2)[1:] would give them
+
+    Only the body is decoded into a string, never the whole file, so a
+    multi-megabyte post is held once rather than three times. Returns None
+    without two --- delimiters.
+    """
+    with mapped(filepath) as data:
+        first, second = split_points(data)
+        if second == -1:
+            return None
+        # Slices are released explicitly: a UnicodeDecodeError's traceback would
+        # otherwise keep one alive and mmap.close() would raise BufferError instead
+        with memoryview(data) as view, view[first + 3:second] as header, view[second + 3:] as body:
+            return _decode(header), _decode(body)
+
+
+def file_sha256(filepath):
+    """SHA-256 of a file's bytes, hashed straight from the mapping"""
+    with mapped(filepath) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+class ContentScan:
+    """What the validator needs from a document, gathered in one bounded-memory pass
+
+    front_matter is the text between the delimiters (None when error says
+    why there isn't any), size is in bytes, long_line is (line number,
+    length) of the first line over MAX_LINE_LENGTH characters or None,
+    body_length is len(body.strip()) and sha256 is the hex digest of the
+    file's bytes (None from scan_text).
+    """
+
+    __slots__ = ('size', 'front_matter', 'error', 'null_byte', 'long_line', 'body_length', 'sha256')
+
+    def __init__(self, size, front_matter, error, null_byte, long_line, body_length, sha256=None):
+        self.size = size
+        self.front_matter = front_matter
+        self.error = error
+        self.null_byte = null_byte
+        self.long_line = long_line
+        self.body_length = body_length
+        self.sha256 = sha256
+
+
+class _TextScanner:
+    """Folds decoded chunks into line and body measurements"""
+
+    def __init__(self):
+        self.newlines = 0
+        self.line_length = 0
+        self.long_line = None
+        self.body_chars = 0
+        self.body_start = None
+        self.body_end = 0
+
+    def feed(self, text, body):
+        if body:
+            self._feed_body(text)
+        if self.long_line is None:
+            self._feed_lines(text)
+
+    def _feed_body(self, text):
+        # Offsets of the first and last non-whitespace characters give len(body.strip())
+        stripped = text.rstrip()
+        if stripped:
+            if self.body_start is None:
+                self.body_start = self.body_chars + len(text) - len(text.lstrip())
+            self.body_end = self.body_chars + len(stripped)
+        self.body_chars += len(text)
+
+    def _feed_lines(self, text):
+        first = text.find('\n')
+        if first == -1:
+            # The current line continues into the next chunk
+            self.line_length += len(text)
+            return
+        length = self.line_length + first
+        if length > MAX_LINE_LENGTH:
+            self.long_line = (self.newlines + 1, length)
+            return
+        last = text.rfind('\n')
+        match = LONG_LINE.search(text, first + 1, last)
+        if match:
+            self.long_line = (self.newlines + text.count('\n', 0, match.start()) + 1,
+                              match.end() - match.start())
+            return
+        self.newlines += text.count('\n')
+        self.line_length = len(text) - last - 1
+
+    def result(self, size, front_matter, error, null_byte, sha256=None):
+        if self.long_line is None and self.line_length > MAX_LINE_LENGTH:
+            self.long_line = (self.newlines + 1, self.line_length)
+        body_length = self.body_end - self.body_start if self.body_start is not None else 0
+        return ContentScan(size, front_matter, error, null_byte, self.long_line, body_length, sha256)
+
+
+def _structure_error(first, second):
+    if first != 0:
+        return "Missing opening front matter delimiter (---)"
+    if second == -1:
+        return "Missing closing front matter delimiter (---)"
+    return None
+
+
+def scan_file(filepath):
+    """Scan and hash a file through mmap; raises OSError or UnicodeDecodeError like open().read() would"""
+    with mapped(filepath) as data:
+        size = len(data)
+        first, second = split_points(data)
+        error = _structure_error(first, second)
+        null_byte = data.find(b'\x00') != -1
+
+        scanner = _TextScanner()
+        decoder = _newline_decoder()
+        digest = hashlib.sha256()
+        front_matter = None
+        start = 0
+        with memoryview(data) as view:
+            if not error:
+                # The opening and closing delimiters are ASCII, so the header decodes on its own
+                start = second + 3
+                with view[:start] as chunk:
+                    digest.update(chunk)
+                    header = decoder.decode(chunk)
+                front_matter = header[3:-3]
+                scanner.feed(header, body=False)
+            while True:
+                end = min(start + SCAN_CHUNK, size)
+                # Released explicitly so a decode error can't leave the mapping exported
+                with view[start:end] as chunk:
+                    digest.update(chunk)
+                    text = decoder.decode(chunk, final=end == size)
+                scanner.feed(text, body=not error)
+                if end == size:
+                    break
+                start = end
+
+    return scanner.result(size, front_matter, error, null_byte, digest.hexdigest())
+
+
+def scan_text(content):
+    """Scan an already-decoded document (e.g. a ZIP member) the same way"""
+    first, second = split_points(content)
+    error = _structure_error(first, second)
+    size = len(content) if content.isascii() else len(content.encode('utf-8'))
+
+    scanner = _TextScanner()
+    front_matter = None
+    start = 0
+    if not error:
+        start = second + 3
+        front_matter = content[3:second]
+        scanner.feed(content[:start], body=False)
+    for offset in range(start, max(len(content), start + 1), SCAN_CHUNK):
+        scanner.feed(content[offset:offset + SCAN_CHUNK], body=not error)
+
+    return scanner.result(size, front_matter, error, '\x00' in content)
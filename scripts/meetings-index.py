@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Build a compact, sorted index of meeting posts (date, title, guid, post_id,
+URL, size) for the meetings web app and KV sync.
+Reuses the clean-meetings.py extractors and only re-parses changed files.
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+from script_loader import load_script
+
+clean_meetings = load_script('clean-meetings.py', 'clean_meetings')
+
+FIELDS = ('date', 'title', 'guid', 'post_id', 'url', 'size')
+
+
+class MeetingRecord:
+    """One index entry; __slots__ keeps per-record memory flat on large archives"""
+
+    __slots__ = FIELDS + ('mtime_ns',)
+
+    def __init__(self, date, title, guid, post_id, url, size, mtime_ns):
+        self.date = date
+        self.title = title
+        self.guid = guid
+        self.post_id = post_id
+        self.url = url
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    @classmethod
+    def from_state(cls, values):
+        return cls(*values)
+
+    def to_state(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def to_index(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+
+def parse_meeting(path, st):
+    """Build a record from one meeting post, or None if it has no front matter"""
+    parts = clean_meetings.read_parts(path)
+    if parts is None:
+        return None
+
+    front_matter, body = parts
+    fields = clean_meetings.parse_front_matter(front_matter)
+
+    # Meeting date from the summary text, then front matter, then the filename prefix
+    date = (clean_meetings.extract_meeting_date(body)
+            or fields.get('date', '')[:10]
+            or path.name[:10])
+
+    post_id = fields.get('post_id')
+    return MeetingRecord(
+        date=date,
+        title=fields.get('title', '').strip('"') or path.stem,
+        guid=fields.get('guid'),
+        post_id=int(post_id) if post_id and post_id.isdigit() else post_id,
+        url=f"/meetings/{path.stem.lower()}/",
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+    )
+
+
+def build_index(meetings_dir, state_path):
+    """Update the index, re-parsing only files whose size or mtime changed
+
+    State is kept as {path: [slot values]}. Returns (records, stats).
+    """
+    state = clean_meetings.load_json(state_path)
+    records = {}
+    stats = {'files': 0, 'parsed': 0, 'removed': 0}
+
+    for entry in os.scandir(meetings_dir):
+        if not entry.name.endswith('.md') or not entry.is_file():
+            continue
+        stats['files'] += 1
+        st = entry.stat()
+        cached = state.get(entry.path)
+        if cached:
+            record = MeetingRecord.from_state(cached)
+            if record.size == st.st_size and record.mtime_ns == st.st_mtime_ns:
+                records[entry.path] = record
+                continue
+
+        stats['parsed'] += 1
+        try:
+            record = parse_meeting(Path(entry.path), st)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠️  {entry.path}: {e}")
+            continue
+        if record:
+            records[entry.path] = record
+
+    stats['removed'] = len(set(state) - set(records))
+    new_state = {path: record.to_state() for path, record in records.items()}
+    if new_state != state:
+        clean_meetings.save_json(new_state, state_path)
+
+    return records, stats
+
+
+def render_index(records):
+    """Compact JSON, newest meeting first (ties broken by URL for a stable order)"""
+    ordered = sorted(records.values(), key=lambda record: record.url)
+    ordered.sort(key=lambda record: record.date, reverse=True)
+    index = {
+        'count': len(ordered),
+        'meetings': [record.to_index() for record in ordered],
+    }
+    return json.dumps(index, separators=(',', ':'), ensure_ascii=False) + '\n'
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build a compact index of meeting posts')
+    parser.add_argument('--meetings-dir', default='content/meetings',
+                        help='Directory of meeting posts (default: content/meetings)')
+    parser.add_argument('--output', default='static/meetings-index.json',
+                        help='Index file to write (default: static/meetings-index.json)')
+    parser.add_argument('--state', default='.cache/meetings-index/state.json',
+                        help='Per-file state used to skip unchanged posts (default: .cache/meetings-index/state.json)')
+    args = parser.parse_args()
+
+    meetings_dir = Path(args.meetings_dir)
+    if not meetings_dir.exists():
+        print(f"❌ Error: {meetings_dir} does not exist")
+        sys.exit(1)
+
+    records, stats = build_index(meetings_dir, Path(args.state))
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    changed = clean_meetings.write_if_changed(output, render_index(records))
+
+    print(f"📋 {len(records)} meetings indexed from {stats['files']} files "
+          f"({stats['parsed']} parsed, {stats['removed']} removed)")
+    print(f"{'✅ Wrote' if changed else '✓ Unchanged:'} {output}")
+
+
+if __name__ == '__main__':
+    main()
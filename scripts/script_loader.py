@@ -0,0 +1,27 @@
+"""
+Import the hyphenated scripts in this directory (clean-meetings.py,
+validate-meetings.py) as modules. Shared by the scripts that reuse them and
+by the tests.
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_script(filename, module_name):
+    """Import a hyphenated script from scripts/ once, under module_name
+
+    The module is registered in sys.modules before it runs, so loading it
+    again returns the same module and worker processes can unpickle its
+    functions by name.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
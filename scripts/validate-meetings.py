@@ -6,132 +6,565 @@ Checks YAML front matter syntax, required fields, and date formats.
 
 import os
 import sys
+import json
+import hashlib
+import zipfile
+import subprocess
 from pathlib import Path
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 import re
 
+import content_scan
+from content_scan import scan_file, scan_text
+
 try:
     import yaml
+    # libyaml's C loader is several times faster when PyYAML was built with it
+    SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     print("Warning: PyYAML not installed. Skipping YAML validation.")
     yaml = None
 
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 50
+# Documents read ahead per worker; bounds memory when validating a large export
+WINDOW_PER_JOB = 64
+
+# Cached results are only reused by the same validator code and YAML loader
+VALIDATOR_VERSION = hashlib.sha256(
+    Path(__file__).read_bytes()
+    + Path(content_scan.__file__).read_bytes()
+    + (f"{yaml.__version__}:{SafeLoader.__name__}" if yaml else 'no-yaml').encode()
+).hexdigest()[:16]
+CACHE_MAX_ENTRIES = 20000
+
 
 def validate_front_matter(filepath):
     """Validate YAML front matter in a markdown file."""
-    errors = []
-    warnings = []
+    return validate_file(filepath)
+
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# (check, kinds) pairs in registration order; see rule()
+RULES = []
+
+
+def rule(*kinds):
+    """Register a check for documents of the given kinds (every kind when none are given).
     
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        errors.append(f"Failed to read file: {str(e)}")
-        return errors, warnings
+    A check takes a ContentDocument and yields (ERROR or WARNING, message).
+    All checks share one scan and one YAML parse of each file, so adding a
+    rule never adds another pass over the content tree.
+    """
+    def register(check):
+        RULES.append((check, frozenset(kinds)))
+        return check
+    return register
+
+
+class ContentDocument:
+    """A content file's scan and parsed front matter, shared by every rule
     
-    # Check for front matter delimiters
-    if not content.startswith('---'):
-        errors.append("Missing opening front matter delimiter (---)")
-        return errors, warnings
+    The body itself isn't kept: rules see its measurements from the scan
+    (size, null_byte, long_line, body_length), so large files are never
+    held in memory whole.
+    """
     
-    # Extract front matter
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        errors.append("Missing closing front matter delimiter (---)")
-        return errors, warnings
+    __slots__ = ('kind', 'data', 'front_matter', 'size', 'null_byte', 'long_line', 'body_length')
     
-    front_matter = parts[1]
-    body = parts[2] if len(parts) > 2 else ""
+    def __init__(self, kind, data, scan):
+        self.kind = kind
+        self.data = data
+        self.front_matter = scan.front_matter
+        self.size = scan.size
+        self.null_byte = scan.null_byte
+        self.long_line = scan.long_line
+        self.body_length = scan.body_length
+
+
+def document_kind(path):
+    """Which rules apply to a content/... path: meeting, redirect, pauwau, post or page"""
+    if is_meeting_path(path):
+        return 'meeting'
+    parts = Path(path).parts
+    section = parts[1] if len(parts) > 2 and parts[0] == 'content' else None
+    if section == 'redirects':
+        return 'redirect'
+    if section == 'pauwau' or parts == ('content', 'pauwau.md'):
+        return 'pauwau'
+    if section and section.isdigit():
+        # content/YYYY/MM/DD/*.md, including untitled microposts
+        return 'post'
+    return 'page'
+
+
+def parse_document(scan, kind):
+    """Parse a scanned document's front matter; returns (ContentDocument or None, error or None)
+    
+    The document is None without an error when PyYAML isn't installed.
+    Front matter with type: redirect (as create-redirect.sh writes it) is
+    checked as a redirect wherever the file lives.
+    """
+    # Missing front matter delimiters
+    if scan.error:
+        return None, scan.error
     
     # If yaml is not available, skip validation
     if yaml is None:
-        return errors, warnings
+        return None, None
     
-    # Try to parse YAML
     try:
-        data = yaml.safe_load(front_matter)
-        
-        if data is None:
-            errors.append("Front matter is empty")
-            return errors, warnings
-        
-        # Check required fields for Micro.blog
-        required = ['title', 'date']
-        for field in required:
-            if field not in data or not data[field]:
-                errors.append(f"Missing or empty required field: {field}")
-        
-        # Validate date format (ISO 8601)
-        if 'date' in data and data['date']:
-            date_str = str(data['date'])
-            # Check for ISO 8601 format: YYYY-MM-DDTHH:MM:SS±HH:MM or YYYY-MM-DD HH:MM:SS±HH:MM
-            # Both 'T' separator and space separator are valid ISO 8601
-            if not re.match(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}', date_str):
-                # Check if it's at least a valid date
-                if not re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-                    errors.append(f"Invalid date format: {date_str} (should be ISO 8601: YYYY-MM-DD[T ]HH:MM:SS±HH:MM)")
-        
-        # Check for recommended fields
-        recommended = ['author', 'categories']
-        for field in recommended:
-            if field not in data or not data[field]:
-                warnings.append(f"Missing recommended field: {field}")
-        
-        # Check for problematic characters in title
-        if 'title' in data and data['title']:
-            title = str(data['title'])
-            if '"' in title or "'" in title:
-                # Check if properly escaped
-                if ('"""' not in front_matter and "'''" not in front_matter and 
-                    (': "' not in front_matter or title.count('"') % 2 != 0)):
-                    warnings.append("Title contains quotes - ensure they are properly escaped in YAML")
-        
-        # Check for microblog field (should be false for long posts)
-        if 'microblog' in data:
-            if data['microblog'] is True and len(body.strip()) > 280:
-                warnings.append("microblog: true but content is longer than 280 characters")
-        
-        # Validate categories format
-        # Note: Micro.blog accepts both list format and comma-separated string
-        # We're using comma-separated string to avoid bracket interpretation issues
-        if 'categories' in data and data['categories']:
-            if not isinstance(data['categories'], (list, str)):
-                errors.append(f"categories should be a list or string, got: {type(data['categories'])}")
-        
-        # Check for invalid control characters in content
-        if '\x00' in content:
-            errors.append("File contains null bytes")
-        
-        # Check file size (Micro.blog might have limits)
-        file_size = len(content.encode('utf-8'))
-        if file_size > 1024 * 1024:  # 1MB
-            warnings.append(f"File is very large: {file_size / 1024:.1f}KB (may cause import issues)")
-        elif file_size > 500 * 1024:  # 500KB
-            warnings.append(f"File is large: {file_size / 1024:.1f}KB")
-        
-        # Check for very long lines that might cause issues
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if len(line) > 10000:
-                warnings.append(f"Line {i} is very long ({len(line)} characters)")
-                break
-    
+        data = yaml.load(scan.front_matter, Loader=SafeLoader)
     except yaml.YAMLError as e:
-        errors.append(f"YAML parsing error: {str(e)}")
+        return None, f"YAML parsing error: {str(e)}"
+    except Exception as e:
+        return None, f"Unexpected error: {str(e)}"
+    
+    if data is None:
+        return None, "Front matter is empty"
+    if not isinstance(data, dict):
+        return None, "Front matter is not a mapping"
+    
+    if data.get('type') == 'redirect':
+        kind = 'redirect'
+    return ContentDocument(kind, data, scan), None
+
+
+def validate_file(filepath, kind='meeting'):
+    """Validate a markdown file, scanning it through mmap rather than reading it whole"""
+    return _validate_path(filepath, kind)[:2]
+
+
+def _validate_path(filepath, kind):
+    """(errors, warnings, SHA-256 of the bytes scanned), the digest None when the scan failed"""
+    try:
+        scan = scan_file(filepath)
     except Exception as e:
-        errors.append(f"Unexpected error: {str(e)}")
+        return [f"Failed to read file: {str(e)}"], [], None
+    
+    return *validate_scan(scan, kind), scan.sha256
+
+
+def validate_text(content, kind='meeting'):
+    """Validate a markdown document's front matter and body.
+    
+    kind picks the rules (see document_kind). Meeting posts get the strict
+    rules (required and recommended fields, microblog length); every kind
+    gets the structure, YAML syntax, date format and file health checks.
+    """
+    return validate_scan(scan_text(content), kind)
+
+
+def validate_scan(scan, kind):
+    """Run every rule registered for kind against one scanned document"""
+    errors = []
+    warnings = []
+    
+    document, error = parse_document(scan, kind)
+    if error:
+        errors.append(error)
+    if document is None:
+        return errors, warnings
+    
+    for check, kinds in RULES:
+        if kinds and document.kind not in kinds:
+            continue
+        try:
+            for level, message in check(document):
+                (errors if level == ERROR else warnings).append(message)
+        except Exception as e:
+            errors.append(f"Unexpected error in {check.__name__}: {str(e)}")
     
     return errors, warnings
 
 
-def main():
-    meetings_dir = Path('content/meetings')
+REQUIRED_FIELDS = {
+    'meeting': ('title', 'date'),
+    'redirect': ('redirect', 'url'),
+}
+RECOMMENDED_FIELDS = {
+    'meeting': ('author', 'categories'),
+    'pauwau': ('title', 'url'),
+    'page': ('title',),
+}
+
+
+@rule()
+def required_fields(document):
+    # Check required fields for Micro.blog
+    for field in REQUIRED_FIELDS.get(document.kind, ()):
+        if field not in document.data or not document.data[field]:
+            yield ERROR, f"Missing or empty required field: {field}"
+
+
+@rule()
+def date_format(document):
+    # Validate date format (ISO 8601)
+    data = document.data
+    if 'date' in data and data['date']:
+        date_str = str(data['date'])
+        # Check for ISO 8601 format: YYYY-MM-DDTHH:MM:SS±HH:MM or YYYY-MM-DD HH:MM:SS±HH:MM
+        # Both 'T' separator and space separator are valid ISO 8601
+        if not re.match(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}', date_str):
+            # Check if it's at least a valid date
+            if not re.match(r'\d{4}-\d{2}-\d{2}', date_str):
+                yield ERROR, f"Invalid date format: {date_str} (should be ISO 8601: YYYY-MM-DD[T ]HH:MM:SS±HH:MM)"
+
+
+@rule()
+def recommended_fields(document):
+    for field in RECOMMENDED_FIELDS.get(document.kind, ()):
+        if field not in document.data or not document.data[field]:
+            yield WARNING, f"Missing recommended field: {field}"
+
+
+@rule()
+def title_quotes(document):
+    # Check for problematic characters in title
+    data = document.data
+    front_matter = document.front_matter
+    if 'title' in data and data['title']:
+        title = str(data['title'])
+        if '"' in title or "'" in title:
+            # Check if properly escaped
+            if ('"""' not in front_matter and "'''" not in front_matter and
+                (': "' not in front_matter or title.count('"') % 2 != 0)):
+                yield WARNING, "Title contains quotes - ensure they are properly escaped in YAML"
+
+
+@rule('meeting')
+def microblog_length(document):
+    # Check for microblog field (should be false for long posts)
+    if document.data.get('microblog') is True and document.body_length > 280:
+        yield WARNING, "microblog: true but content is longer than 280 characters"
+
+
+@rule()
+def categories_format(document):
+    # Validate categories format
+    # Note: Micro.blog accepts both list format and comma-separated string
+    # We're using comma-separated string to avoid bracket interpretation issues
+    categories = document.data.get('categories')
+    if categories and not isinstance(categories, (list, str)):
+        yield ERROR, f"categories should be a list or string, got: {type(categories)}"
+
+
+@rule('redirect')
+def redirect_target(document):
+    # Stubs from scripts/create-redirect.sh: url is the old path, redirect the new one
+    url = str(document.data.get('url') or '')
+    target = str(document.data.get('redirect') or '')
+    if url and not url.startswith('/'):
+        yield ERROR, f"Redirect url should be a site path starting with /: {url}"
+    if target and not target.startswith(('/', 'http://', 'https://')):
+        yield ERROR, f"Redirect target should be a site path or http(s) URL: {target}"
+    if url and target and url.rstrip('/') == target.rstrip('/'):
+        yield ERROR, f"Redirect points at itself: {url}"
+
+
+@rule('pauwau')
+def pauwau_url(document):
+    url = str(document.data.get('url') or '')
+    if url and not url.startswith('/pauwau/'):
+        yield WARNING, f"Pauwau page url is outside /pauwau/: {url}"
+
+
+@rule()
+def registration_url(document):
+    # Zeffy campaign pages embed this URL in an iframe
+    zeffy_url = document.data.get('zeffy_url')
+    if zeffy_url and not str(zeffy_url).startswith('https://'):
+        yield ERROR, f"zeffy_url should be an https:// link: {zeffy_url}"
+
+
+@rule()
+def null_bytes(document):
+    # Check for invalid control characters in content
+    if document.null_byte:
+        yield ERROR, "File contains null bytes"
+
+
+@rule()
+def file_size(document):
+    # Check file size (Micro.blog might have limits)
+    size = document.size
+    if size > 1024 * 1024:  # 1MB
+        yield WARNING, f"File is very large: {size / 1024:.1f}KB (may cause import issues)"
+    elif size > 500 * 1024:  # 500KB
+        yield WARNING, f"File is large: {size / 1024:.1f}KB"
+
+
+@rule()
+def long_lines(document):
+    # Check for very long lines that might cause issues
+    if document.long_line:
+        line_number, length = document.long_line
+        yield WARNING, f"Line {line_number} is very long ({length} characters)"
+
+
+def zip_markdown_members(zipf):
+    """Sorted (member path, ZipInfo) pairs for content/**/*.md members of an export ZIP.
     
-    if not meetings_dir.exists():
-        print(f"❌ Error: {meetings_dir} does not exist")
-        sys.exit(1)
+    Only the central directory is read. Paths are relative to the theme
+    root, which may be a top-level directory.
+    """
+    members = []
+    for info in zipf.infolist():
+        name = info.filename
+        if info.is_dir() or not name.endswith('.md') or '__MACOSX' in name:
+            continue
+        parts = name.split('/')
+        if parts[0] != 'content':
+            if len(parts) < 2 or parts[1] != 'content':
+                continue
+            parts = parts[1:]
+        if parts[-1].startswith('._'):
+            continue
+        members.append(('/'.join(parts), info))
+    members.sort(key=lambda member: member[0])
+    return members
+
+
+def read_zip_member(zipf, info):
+    """A member's text, decoded as strictly as a file on disk; the UnicodeDecodeError if it isn't UTF-8"""
+    try:
+        return zipf.read(info).decode('utf-8')
+    except UnicodeDecodeError as e:
+        return e
+
+
+def is_meeting_path(path):
+    """content/meetings/*.md, the posts that get the strict meeting rules"""
+    parts = Path(path).parts
+    return len(parts) == 3 and parts[0] == 'content' and parts[1] == 'meetings'
+
+
+def resolve_jobs(jobs, file_count):
+    """Worker count: 0 means one per CPU, None picks serial or per-CPU by file count"""
+    if jobs is None:
+        jobs = 0 if file_count >= PARALLEL_MIN_FILES else 1
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, file_count))
+
+
+class ValidationCache:
+    """Validation results keyed on content hash and document kind
     
-    print("🔍 Validating meeting files for Micro.blog compatibility...\n")
+    Files are looked up by path first: each validated file's size, mtime
+    and digest are recorded, so an unchanged file is found with one stat()
+    and never read. Any other file is validated in a single scan that also
+    hashes it. The whole cache is dropped when VALIDATOR_VERSION changes.
+    Entries and files are kept in least-recently-used order and trimmed to
+    CACHE_MAX_ENTRIES. Hits only reorder them in memory; the file is
+    rewritten when a result is added or entries have to be evicted, so an
+    all-hit run leaves it alone.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        self.files = {}
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == VALIDATOR_VERSION:
+            self.entries = data.get('entries', {})
+            self.files = data.get('files', {})
+    
+    @staticmethod
+    def key(digest, kind):
+        return f"{digest}:{kind}"
+    
+    @staticmethod
+    def text_key(text, kind):
+        """Cache key for a document's text"""
+        return ValidationCache.key(hashlib.sha256(text.encode('utf-8', errors='replace')).hexdigest(), kind)
+    
+    @staticmethod
+    def file_signature(filepath):
+        """[size, mtime] of a file; raises OSError like open() would"""
+        stat = os.stat(filepath)
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def file_key(self, filepath, signature, kind):
+        """Cache key of a file last validated with this signature, else None"""
+        path = os.path.abspath(filepath)
+        known = self.files.pop(path, None)
+        if known is None:
+            return None
+        self.files[path] = known
+        return self.key(known[2], kind) if known[:2] == signature else None
+    
+    def record_file(self, filepath, signature, digest):
+        """Remember the digest a file had when it had this signature"""
+        path = os.path.abspath(filepath)
+        self.files.pop(path, None)
+        self.files[path] = [*signature, digest]
+        self.dirty = True
+    
+    def get(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        self.entries[key] = entry
+        return entry['errors'], entry['warnings']
+    
+    def put(self, key, errors, warnings):
+        self.entries[key] = {'errors': errors, 'warnings': warnings}
+        self.dirty = True
+    
+    def save(self):
+        if not self.dirty and max(len(self.entries), len(self.files)) <= CACHE_MAX_ENTRIES:
+            return
+        entries = list(self.entries.items())[-CACHE_MAX_ENTRIES:]
+        files = list(self.files.items())[-CACHE_MAX_ENTRIES:]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'version': VALIDATOR_VERSION, 'entries': dict(entries),
+                                        'files': dict(files)}),
+                            encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def _validate_document(document):
+    """(name, errors, warnings, digest of a scanned file or None)"""
+    name, source, kind = document
+    if isinstance(source, str):
+        return name, *validate_text(source, kind=kind), None
+    return name, *_validate_path(source, kind)
+
+
+def validate_documents(documents, jobs=None, cache=None, count=None):
+    """Yield (name, errors, warnings) for (name, source, kind) documents, in order
+    
+    A source is the document's text, the Path of a file to scan, or the
+    exception raised reading it. documents may be a generator (count then
+    sizes the pool); it is consumed WINDOW_PER_JOB documents per worker at a
+    time, so a large export is never held in memory whole. Cached results
+    are reused; the pool is only started once a document needs validating,
+    and each file that does is read once, by the scan that validates it.
+    """
+    if count is None:
+        documents = list(documents)
+        count = len(documents)
+    jobs = resolve_jobs(jobs, count)
+    documents = iter(documents)
+    pool = None
+    try:
+        while window := list(islice(documents, jobs * WINDOW_PER_JOB)):
+            results = [None] * len(window)
+            keys = {}
+            signatures = {}
+            misses = []
+            for i, (name, source, kind) in enumerate(window):
+                if isinstance(source, Exception):
+                    results[i] = (name, [f"Failed to read file: {str(source)}"], [])
+                    continue
+                if cache:
+                    if isinstance(source, str):
+                        keys[i] = cache.text_key(source, kind)
+                    else:
+                        try:
+                            signatures[i] = cache.file_signature(source)
+                        except OSError:
+                            # Unreadable; validating it reports the error
+                            misses.append(i)
+                            continue
+                        keys[i] = cache.file_key(source, signatures[i], kind)
+                    cached = keys[i] and cache.get(keys[i])
+                    if cached:
+                        results[i] = (name, *cached)
+                        continue
+                misses.append(i)
+            
+            if jobs > 1 and misses:
+                pool = pool or ProcessPoolExecutor(max_workers=jobs)
+                validated = pool.map(_validate_document, [window[i] for i in misses],
+                                     chunksize=max(1, len(misses) // (jobs * 4)))
+            else:
+                validated = map(_validate_document, [window[i] for i in misses])
+            for i, (name, errors, warnings, digest) in zip(misses, validated):
+                results[i] = (name, errors, warnings)
+                if digest and i in signatures:
+                    cache.record_file(window[i][1], signatures[i], digest)
+                    keys[i] = cache.key(digest, window[i][2])
+                if keys.get(i):
+                    cache.put(keys[i], errors, warnings)
+            
+            yield from results
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        if cache:
+            cache.save()
+
+
+def validate_zip(zip_path, jobs=None, cache=None):
+    """Yield (name, errors, warnings) for every content/**/*.md member of an export ZIP
+    
+    Members are decompressed one at a time, in name order, as validation
+    reaches them; nothing is extracted.
+    """
+    with zipfile.ZipFile(zip_path) as zipf:
+        members = zip_markdown_members(zipf)
+        documents = ((name, read_zip_member(zipf, info), document_kind(name)) for name, info in members)
+        yield from validate_documents(documents, jobs, cache, count=len(members))
+
+
+def validate_directory(meetings_dir, jobs=None, cache=None):
+    """Yield (name, errors, warnings) for each meeting file in a directory"""
+    documents = [(filepath.name, filepath, 'meeting') for filepath in sorted(meetings_dir.glob('*.md'))]
+    yield from validate_documents(documents, jobs, cache)
+
+
+def validate_tree(content_dir, jobs=None, cache=None):
+    """Yield (name, errors, warnings) for every markdown file under a content tree
     
+    Names are content/... paths so pages, pauwau pages, redirect stubs and
+    meeting posts each get their own rules whatever the directory is called.
+    """
+    documents = []
+    for filepath in sorted(content_dir.rglob('*.md')):
+        name = f"content/{filepath.relative_to(content_dir).as_posix()}"
+        documents.append((name, filepath, document_kind(name)))
+    yield from validate_documents(documents, jobs, cache)
+
+
+def validate_paths(paths, jobs=None, cache=None):
+    """Yield (name, errors, warnings) for the content/**/*.md files among paths
+    
+    Paths are relative to the repository root (as `git diff --name-only`
+    prints them); deleted files and anything outside content/ are skipped.
+    """
+    documents = []
+    for path in sorted({Path(os.path.relpath(path)).as_posix() for path in paths}):
+        if path.startswith('content/') and path.endswith('.md') and os.path.isfile(path):
+            documents.append((path, Path(path), document_kind(path)))
+    yield from validate_documents(documents, jobs, cache)
+
+
+def changed_since(ref):
+    """Content files changed since a git ref, plus untracked ones"""
+    commands = (
+        ['git', 'diff', '--name-only', '--diff-filter=d', ref, '--', 'content/'],
+        ['git', 'ls-files', '--others', '--exclude-standard', '--', 'content/'],
+    )
+    paths = []
+    for command in commands:
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        paths.extend(line for line in output.splitlines() if line)
+    return paths
+
+
+def report(results, label='meeting files'):
+    """Print per-file results and a summary; return the process exit code"""
     all_valid = True
     total_files = 0
     error_count = 0
@@ -141,21 +574,20 @@ def main():
     files_with_errors = []
     files_with_warnings = []
     
-    for filepath in sorted(meetings_dir.glob('*.md')):
+    for name, errors, warnings in results:
         total_files += 1
-        errors, warnings = validate_front_matter(filepath)
         
         if errors:
             all_valid = False
             error_count += len(errors)
-            files_with_errors.append(filepath.name)
-            print(f"❌ {filepath.name}")
+            files_with_errors.append(name)
+            print(f"❌ {name}")
             for error in errors:
                 print(f"   ERROR: {error}")
         elif warnings:
             warning_count += len(warnings)
-            files_with_warnings.append(filepath.name)
-            print(f"⚠️  {filepath.name}")
+            files_with_warnings.append(name)
+            print(f"⚠️  {name}")
             for warning in warnings:
                 print(f"   WARNING: {warning}")
     
@@ -170,17 +602,94 @@ def main():
     print(f"Total warnings: {warning_count}")
     
     if all_valid and warning_count == 0:
-        print(f"\n✅ All meeting files are valid!")
-        sys.exit(0)
+        print(f"\n✅ All {label} are valid!")
+        return 0
     elif all_valid:
         print(f"\n✅ All files passed validation (with {warning_count} warnings)")
-        sys.exit(0)
+        return 0
     else:
         print(f"\n❌ Validation failed! Fix errors before exporting.")
         print(f"\nFiles with errors:")
         for filename in files_with_errors:
             print(f"  - {filename}")
+        return 1
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Validate meeting markdown files for Micro.blog compatibility')
+    parser.add_argument('--zip', dest='zip_path',
+                        help='Validate content/**/*.md inside an export ZIP without extracting it')
+    parser.add_argument('--meetings-dir', default='content/meetings',
+                        help='Directory of meeting posts to validate (default: content/meetings)')
+    parser.add_argument('--content-dir', metavar='DIR',
+                        help='Validate every markdown file under a content tree: pages, pauwau pages, '
+                             'redirect stubs and meeting posts')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help=f'Worker processes (0 = one per CPU; default: one per CPU from '
+                             f'{PARALLEL_MIN_FILES} files, otherwise serial)')
+    parser.add_argument('--changed-since', metavar='REF',
+                        help='Only validate content files changed since a git ref (plus untracked files)')
+    parser.add_argument('--files-from', metavar='FILE',
+                        help="Only validate content files listed in FILE, one per line ('-' reads stdin)")
+    parser.add_argument('--cache', default='.cache/validate-meetings.json',
+                        help='Result cache keyed on file hash and validator version '
+                             '(default: .cache/validate-meetings.json)')
+    parser.add_argument('--no-cache', action='store_true', help='Validate every file, ignoring the result cache')
+    args = parser.parse_args()
+    
+    cache = None if args.no_cache else ValidationCache(args.cache)
+    
+    if args.changed_since or args.files_from:
+        if args.files_from == '-':
+            paths = sys.stdin.read().splitlines()
+        elif args.files_from:
+            with open(args.files_from, 'r', encoding='utf-8') as f:
+                paths = f.read().splitlines()
+        else:
+            try:
+                paths = changed_since(args.changed_since)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"❌ Error: could not list changes since {args.changed_since}: "
+                      f"{getattr(e, 'stderr', None) or e}")
+                sys.exit(1)
+        
+        print("🔍 Validating changed content files for Micro.blog compatibility...\n")
+        sys.exit(report(validate_paths([path.strip() for path in paths if path.strip()], jobs=args.jobs, cache=cache),
+                        label='changed content files'))
+    
+    if args.zip_path:
+        zip_path = Path(args.zip_path)
+        if not zip_path.exists():
+            print(f"❌ Error: {zip_path} does not exist")
+            sys.exit(1)
+        
+        print(f"🔍 Validating {zip_path.name} in place for Micro.blog compatibility...\n")
+        try:
+            sys.exit(report(validate_zip(zip_path, jobs=args.jobs, cache=cache), label='content files'))
+        except zipfile.BadZipFile as e:
+            print(f"❌ Error: {zip_path} is not a readable ZIP: {e}")
+            sys.exit(1)
+    
+    if args.content_dir:
+        content_dir = Path(args.content_dir)
+        if not content_dir.is_dir():
+            print(f"❌ Error: {content_dir} does not exist")
+            sys.exit(1)
+        
+        print(f"🔍 Validating {content_dir}/ for Micro.blog compatibility...\n")
+        sys.exit(report(validate_tree(content_dir, jobs=args.jobs, cache=cache), label='content files'))
+    
+    meetings_dir = Path(args.meetings_dir)
+    
+    if not meetings_dir.exists():
+        print(f"❌ Error: {meetings_dir} does not exist")
         sys.exit(1)
+    
+    print("🔍 Validating meeting files for Micro.blog compatibility...\n")
+    
+    sys.exit(report(validate_directory(meetings_dir, jobs=args.jobs, cache=cache)))
 
 
 if __name__ == '__main__':
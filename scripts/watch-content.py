@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Watch content/ and re-validate (and optionally re-clean) only the markdown
+files that changed. Uses fswatch or inotifywait when available and falls
+back to polling, like the email template watcher in apps/justfile.
+"""
+
+import os
+import sys
+import time
+import queue
+import shutil
+import threading
+import subprocess
+from pathlib import Path
+
+from script_loader import load_script
+
+validate_meetings = load_script('validate-meetings.py', 'validate_meetings')
+
+POLL_INTERVAL = 0.5
+
+
+def watch_command(root):
+    """Native watcher command printing one changed path per line, or None"""
+    if shutil.which('fswatch'):
+        return ['fswatch', '-r', '--event', 'Created', '--event', 'Updated',
+                '--event', 'Removed', '--event', 'Renamed', str(root)]
+    if shutil.which('inotifywait'):
+        return ['inotifywait', '-m', '-r', '-q', '-e', 'close_write,create,moved_to,moved_from,delete',
+                '--format', '%w%f', str(root)]
+    return None
+
+
+def _read_events(process, events):
+    for line in process.stdout:
+        events.put(line.rstrip('\n'))
+
+
+def _snapshot(root):
+    snapshot = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith('.md'):
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+def _poll_events(root, events):
+    """Fallback: compare mtimes/sizes every POLL_INTERVAL and report differences"""
+    previous = _snapshot(root)
+    while True:
+        time.sleep(POLL_INTERVAL)
+        current = _snapshot(root)
+        for path in current.keys() | previous.keys():
+            if current.get(path) != previous.get(path):
+                events.put(path)
+        previous = current
+
+
+def start_watcher(root, events):
+    """Start a background thread feeding changed paths into events; returns a description"""
+    command = watch_command(root)
+    if command:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        threading.Thread(target=_read_events, args=(process, events), daemon=True).start()
+        return command[0]
+
+    print("⚠️  No file watcher found (fswatch/inotifywait), using polling...")
+    threading.Thread(target=_poll_events, args=(root, events), daemon=True).start()
+    return f"polling every {POLL_INTERVAL}s"
+
+
+def collect_batch(events, debounce):
+    """Block for the first event, then gather more until debounce seconds pass quietly"""
+    batch = {events.get()}
+    while True:
+        try:
+            batch.add(events.get(timeout=debounce))
+        except queue.Empty:
+            return batch
+
+
+def validate_changed(paths, root):
+    """Validate changed markdown files; returns (files, errors)"""
+    files = errors = 0
+    for path in sorted(paths):
+        # document_kind expects content/... relative to the repository root
+        name = Path(os.path.relpath(path, root.parent)).as_posix()
+        if not os.path.exists(path):
+            print(f"   🗑️  {name} removed")
+            continue
+
+        files += 1
+        file_errors, file_warnings = validate_meetings.validate_file(
+            path, kind=validate_meetings.document_kind(name))
+        if file_errors:
+            errors += 1
+            print(f"   ❌ {name}")
+            for error in file_errors:
+                print(f"      ERROR: {error}")
+        else:
+            print(f"   ✅ {name}")
+        for warning in file_warnings:
+            print(f"      WARNING: {warning}")
+    return files, errors
+
+
+def clean_changed(paths, clean_meetings):
+    """Re-clean changed meeting posts outside meetings/; their outputs trigger validation next
+
+    A post that fails to clean is reported and skipped so the watcher keeps
+    running. Cleaned posts are recorded in clean-meetings.py's result cache,
+    so the next batch run doesn't redo them.
+    """
+    cache = clean_meetings.load_result_cache()
+    cleaned = 0
+    for path in sorted(paths):
+        if '/meetings/' in path or not os.path.exists(path) or not clean_meetings.is_meeting_post(path):
+            continue
+        try:
+            # Hashed first: if the post changes mid-clean, the next run sees a new hash
+            sha256 = clean_meetings.file_sha256(path)
+            result = clean_meetings.process_meeting_file(path)
+            if not result:
+                continue
+            if clean_meetings.write_if_changed(result['new_path'], result['content']):
+                print(f"  ✓ Updated {result['new_path']}")
+        except Exception as e:
+            print(f"  ❌ Failed to clean {path}: {e}")
+            continue
+        clean_meetings.record_result(cache, path, sha256, result['new_path'])
+        cleaned += 1
+
+    if cleaned:
+        try:
+            clean_meetings.save_json(cache, clean_meetings.RESULT_CACHE)
+        except OSError as e:
+            print(f"  ⚠️  Could not update {clean_meetings.RESULT_CACHE}: {e}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Re-validate changed content files as you edit')
+    parser.add_argument('--content-dir', default='content', help='Directory to watch (default: content)')
+    parser.add_argument('--clean', action='store_true',
+                        help='Also re-run clean-meetings.py on changed meeting posts outside content/meetings')
+    parser.add_argument('--debounce', type=float, default=0.2,
+                        help='Seconds of quiet before a batch of changes is processed (default: 0.2)')
+    args = parser.parse_args()
+
+    root = Path(args.content_dir).resolve()
+    if not root.is_dir():
+        print(f"❌ Error: {args.content_dir} does not exist")
+        sys.exit(1)
+
+    clean_meetings = load_script('clean-meetings.py', 'clean_meetings') if args.clean else None
+
+    events = queue.Queue()
+    method = start_watcher(root, events)
+    print(f"👀 Watching {args.content_dir}/ for changes ({method})...")
+    print("   Press Ctrl+C to stop")
+
+    try:
+        while True:
+            batch = {path for path in collect_batch(events, args.debounce) if path.endswith('.md')}
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            print(f"\n🔄 {len(batch)} file(s) changed")
+            if clean_meetings:
+                clean_changed(batch, clean_meetings)
+            files, errors = validate_changed(batch, root)
+            elapsed = (time.perf_counter() - start) * 1000
+            status = '❌' if errors else '✅'
+            print(f"{status} {files} validated, {errors} with errors ({elapsed:.0f}ms)")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+if __name__ == '__main__':
+    main()
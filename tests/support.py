@@ -0,0 +1,19 @@
+"""
+Shared helpers for the tests of the content scripts.
+
+The scripts and deploy tools import their sibling modules (content_scan,
+stream_zip) the way they would when run from their own directories, so
+both directories go on sys.path first. Hyphenated scripts are loaded with
+script_loader.load_script, as the scripts load each other.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / 'scripts'
+DEPLOY_DIR = REPO_ROOT / '.github' / 'deploy'
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(DEPLOY_DIR))
+
+from script_loader import load_script  # noqa: E402,F401
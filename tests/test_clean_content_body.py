@@ -0,0 +1,42 @@
+"""
+Golden-file equivalence for clean_content_body's streaming stages.
+
+Each golden/clean_content_body/NAME.md is a post body and NAME.expected.md
+is what the whole-string implementation that preceded the line stages
+produced for it (plus a final newline). Only regenerate an expected file
+when a cleanup rule changes on purpose.
+"""
+
+import unittest
+from pathlib import Path
+
+from support import load_script
+
+clean_meetings = load_script('clean-meetings.py', 'clean_meetings')
+
+GOLDEN_DIR = Path(__file__).resolve().parent / 'golden' / 'clean_content_body'
+
+
+def golden_cases():
+    """(name, body, expected) for every input with an expected output"""
+    for path in sorted(GOLDEN_DIR.glob('*.md')):
+        if path.name.endswith('.expected.md'):
+            continue
+        expected = path.with_suffix('.expected.md')
+        yield (path.stem, path.read_text(encoding='utf-8'),
+               expected.read_text(encoding='utf-8') if expected.exists() else None)
+
+
+class CleanContentBodyGoldenTest(unittest.TestCase):
+
+    def test_golden_files(self):
+        cases = list(golden_cases())
+        self.assertTrue(cases, f"no golden inputs in {GOLDEN_DIR}")
+        for name, body, expected in cases:
+            with self.subTest(name):
+                self.assertIsNotNone(expected, f"{name}.expected.md is missing")
+                self.assertEqual(clean_meetings.clean_content_body(body) + '\n', expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
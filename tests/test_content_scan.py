@@ -0,0 +1,77 @@
+"""
+Undecodable posts must surface as UnicodeDecodeError, not as a BufferError
+from closing a mapping that a failed decode left exported.
+"""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from support import load_script
+
+import content_scan
+
+validate_meetings = load_script('validate-meetings.py', 'validate_meetings')
+meetings_index = load_script('meetings-index.py', 'meetings_index')
+
+GOOD_POST = b'''---
+title: "April Open Meeting Summary"
+date: 2023-04-23T10:00:00-05:00
+guid: http://waccamaw.micro.blog/2023/04/23/101.html
+post_id: 4000101
+---
+
+# April Open Meeting Summary
+
+The council met on April 23, 2023 and approved the minutes.
+'''
+
+# Latin-1 e-acute, as an editor saving in the wrong encoding would write it
+LATIN1_POST = GOOD_POST.replace(b'approved', b'approv\xe9')
+
+
+class NonUtf8PostTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.bad = self.root / '2023-04-23-bad.md'
+        self.bad.write_bytes(LATIN1_POST)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_read_parts_raises_decode_error(self):
+        with self.assertRaises(UnicodeDecodeError):
+            content_scan.read_parts(self.bad)
+
+    def test_scan_file_raises_decode_error_in_header(self):
+        self.bad.write_bytes(LATIN1_POST.replace(b'April Open', b'Abril \xe9'))
+        with self.assertRaises(UnicodeDecodeError):
+            content_scan.scan_file(self.bad)
+
+    def test_scan_file_raises_decode_error_in_later_chunk(self):
+        body = b'a' * content_scan.SCAN_CHUNK + b'\n\xe9\n'
+        self.bad.write_bytes(GOOD_POST + body)
+        with self.assertRaises(UnicodeDecodeError):
+            content_scan.scan_file(self.bad)
+
+    def test_validate_file_reports_read_failure(self):
+        errors, warnings = validate_meetings.validate_file(self.bad)
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith("Failed to read file: 'utf-8' codec can't decode"), errors[0])
+
+    def test_build_index_skips_undecodable_post(self):
+        good = self.root / '2023-04-23-good.md'
+        good.write_bytes(GOOD_POST)
+        with redirect_stdout(io.StringIO()) as output:
+            records, stats = meetings_index.build_index(self.root, self.root / 'state.json')
+        self.assertIn(str(self.bad), output.getvalue())
+        self.assertEqual(list(records), [str(good)])
+        self.assertEqual(stats['parsed'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
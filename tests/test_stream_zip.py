@@ -0,0 +1,76 @@
+"""
+stream_extract must pick the same members as the ZIP-file extractor: the
+theme prefix is fixed once, and only <prefix><top_dir>/... members map.
+"""
+
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+import support  # noqa: F401  (puts .github/deploy on sys.path)
+
+from stream_zip import stream_extract
+
+TOP_DIRS = ['content', 'static', 'data']
+
+
+def archive_chunks(members, chunk_size=1000):
+    """Chunks of a ZIP holding members ({name: bytes}, in order), as a download yields them"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for name, data in members.items():
+            zipf.writestr(name, data)
+    data = buffer.getvalue()
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+class StreamExtractTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def extracted(self, members):
+        stream_extract(archive_chunks(members), self.dest, TOP_DIRS)
+        return sorted(path.relative_to(self.dest).as_posix()
+                      for path in self.dest.rglob('*') if path.is_file())
+
+    def test_root_level_export_ignores_nested_top_dir_names(self):
+        files = self.extracted({
+            'config.json': b'{}',
+            'content/2023/04/23/meeting.md': b'---\ntitle: x\n---\n',
+            'assets/static/y.css': b'nested',
+            'layouts/data/x.html': b'nested',
+            'static/z.css': b'body {}',
+            'data/menu.json': b'[]',
+        })
+        self.assertEqual(files, ['content/2023/04/23/meeting.md', 'data/menu.json', 'static/z.css'])
+        self.assertEqual((self.dest / 'static' / 'z.css').read_bytes(), b'body {}')
+
+    def test_root_level_export_starting_with_layouts(self):
+        files = self.extracted({
+            'layouts/index.html': b'<html>',
+            'content/about.md': b'---\n---\n',
+        })
+        self.assertEqual(files, ['content/about.md'])
+
+    def test_theme_directory_export(self):
+        files = self.extracted({
+            'theme/': b'',
+            'theme/content/about.md': b'---\n---\n',
+            'theme/static/z.css': b'body {}',
+            'theme/layouts/data/x.html': b'nested',
+            'theme/assets/static/y.css': b'nested',
+            'other/content/stray.md': b'---\n---\n',
+            'content/outside-theme.md': b'---\n---\n',
+        })
+        self.assertEqual(files, ['content/about.md', 'static/z.css'])
+
+
+if __name__ == '__main__':
+    unittest.main()
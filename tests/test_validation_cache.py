@@ -0,0 +1,81 @@
+"""
+With the result cache on, a file is read at most once per run: unchanged
+files are found by size and mtime without being read, and any other file is
+hashed by the same scan that validates it.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import load_script
+
+validate_meetings = load_script('validate-meetings.py', 'validate_meetings')
+
+POST = b'''---
+title: "April Open Meeting Summary"
+date: 2023-04-23T10:00:00-05:00
+author: Council
+categories: [meetings]
+---
+
+The council met on April 23, 2023 and approved the minutes.
+'''
+
+
+class ValidationCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.meetings = os.path.join(self.tmp.name, 'meetings')
+        os.mkdir(self.meetings)
+        self.paths = []
+        for day in range(1, 4):
+            path = os.path.join(self.meetings, f'2023-04-0{day}-meeting.md')
+            with open(path, 'wb') as f:
+                f.write(POST)
+            self.paths.append(path)
+        self.cache_path = os.path.join(self.tmp.name, 'cache.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def validate(self):
+        """(results, files scanned) for one run with a freshly loaded cache"""
+        cache = validate_meetings.ValidationCache(self.cache_path)
+        scan = mock.Mock(wraps=validate_meetings.scan_file)
+        with mock.patch.object(validate_meetings, 'scan_file', scan):
+            results = list(validate_meetings.validate_directory(Path(self.meetings), jobs=1, cache=cache))
+        return results, sorted(os.path.basename(call.args[0]) for call in scan.call_args_list)
+
+    def test_each_file_is_read_once_then_found_by_stat(self):
+        first, scanned = self.validate()
+        self.assertEqual(scanned, sorted(map(os.path.basename, self.paths)))
+        second, scanned = self.validate()
+        self.assertEqual(scanned, [])
+        self.assertEqual(second, first)
+
+    @unittest.skipUnless(validate_meetings.yaml, 'PyYAML not installed')
+    def test_changed_file_is_rescanned(self):
+        self.validate()
+        with open(self.paths[1], 'wb') as f:
+            f.write(POST.replace(b'title: "April Open Meeting Summary"\n', b''))
+        os.utime(self.paths[1], ns=(0, 0))
+        results, scanned = self.validate()
+        self.assertEqual(scanned, [os.path.basename(self.paths[1])])
+        self.assertEqual(results[1][1], ['Missing or empty required field: title'])
+
+    def test_touched_file_is_rescanned_once(self):
+        first, _ = self.validate()
+        os.utime(self.paths[0], ns=(0, 0))
+        results, scanned = self.validate()
+        self.assertEqual(scanned, [os.path.basename(self.paths[0])])
+        self.assertEqual(results, first)
+        _, scanned = self.validate()
+        self.assertEqual(scanned, [])
+
+
+if __name__ == '__main__':
+    unittest.main()